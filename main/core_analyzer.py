@@ -78,7 +78,7 @@ def analyze_news_credibility(
     global SEARXNG_AVAILABLE
     if use_online:
         logger.debug("正在重新检查SearXNG连接状态...")
-        test_searxng_connection()
+        SEARXNG_AVAILABLE = test_searxng_connection()
     
     if use_ai_services and not DEEPSEEK_API_AVAILABLE:
         logger.warning("DeepSeek API不可用，将使用本地算法进行分析，精度可能受限")
@@ -6,9 +6,16 @@
 负责对分析结果进行格式化和显示
 """
 
+import os
+import re
+import reprlib
 import sys
 import logging
 import traceback
+from bisect import bisect_right
+from functools import lru_cache, partial
+from itertools import islice
+from operator import itemgetter
 from typing import Dict, Any, Tuple
 from config import (
     colorama_available, Fore, Style,
@@ -27,6 +34,123 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 输出调色板，顺序与print_formatted_result中的解包顺序一致；关闭彩色输出时使用空字符串版本
+_COLOR_PALETTE = (
+    TITLE_COLOR, HEADER_COLOR, SUBHEADER_COLOR, SECTION_COLOR, DETAIL_COLOR,
+    WARNING_COLOR, ERROR_COLOR, SUCCESS_COLOR, INFO_COLOR, NEUTRAL_COLOR, RESET_COLOR
+)
+_PLAIN_PALETTE = ("",) * len(_COLOR_PALETTE)
+_ANSI_ESCAPE_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+# 分隔线与报告顶部/底部横幅，导入时构建一次
+_RULE_THIN = '━' * 70
+_RULE_THICK = '=' * 70
+_HEADER_BANNER = f"{HEADER_COLOR}{_RULE_THICK}{RESET_COLOR}"
+_PLAIN_HEADER_BANNER = _RULE_THICK
+
+# 预先生成的进度条字符，生成进度条时直接切片
+_BAR_MAX_WIDTH = 20
+_BAR_FULL = '█' * _BAR_MAX_WIDTH
+_BAR_EMPTY = '░' * _BAR_MAX_WIDTH
+
+# 六个主要评分维度（顺序即显示顺序）
+_MAIN_DIMENSIONS = ("内容真实性", "信息准确性", "来源可靠性", "引用质量", "语言客观性", "逻辑连贯性")
+_MAIN_DIMENSION_SET = frozenset(_MAIN_DIMENSIONS)
+
+# 各评分项的说明文本：(键名, 说明)，顺序即显示顺序
+_DIMENSION_DESCRIPTIONS = (
+    ("内容真实性", "新闻内容与事实的符合程度"),
+    ("信息准确性", "信息的精确性和完整性"),
+    ("来源可靠性", "信息来源的权威性和可信度"),
+    ("引用质量", "引用的准确性和相关性"),
+    ("语言客观性", "语言表达的中立性和客观性"),
+    ("逻辑连贯性", "内容的逻辑性和连贯性"),
+)
+_AI_FEATURE_DESCRIPTIONS = (
+    ("expression_pattern", "表达模式 (句式结构的人类特征)"),
+    ("vocabulary_diversity", "词汇多样性 (用词丰富度的人类特征)"),
+    ("sentence_variation", "句子变化 (句式变化多样性的人类特征)"),
+    ("context_coherence", "上下文连贯性 (逻辑流畅度的人类特征)"),
+    ("human_traits", "人类特征 (文本中的人类思维特征)"),
+    ("表达模式", "表达模式 (句式结构的人类特征)"),
+    ("词汇多样性", "词汇多样性 (用词丰富度的人类特征)"),
+    ("句子变化", "句子变化 (句式变化多样性的人类特征)"),
+    ("上下文连贯性", "上下文连贯性 (逻辑流畅度的人类特征)"),
+    ("人类特征", "人类特征 (文本中的人类思维特征)"),
+)
+_NEUTRALITY_DESCRIPTIONS = (
+    ("情感词汇", "文本中情感色彩词汇的使用程度"),
+    ("情感平衡", "正面与负面情感的平衡程度"),
+    ("极端表述", "极端或绝对化表述的使用程度"),
+    ("煽动性表达", "可能引起强烈情感反应的表达"),
+    ("主观评价", "个人观点和主观判断的程度"),
+)
+_LANGUAGE_SCORE_DESCRIPTIONS = (
+    ("语言客观性", "语言表达的客观中立程度"),
+    ("逻辑连贯性", "内容的逻辑性和连贯性"),
+    ("表达准确性", "用词和表达的准确程度"),
+    ("专业性", "专业术语和概念的使用准确性"),
+)
+
+# 结果字典中各类数据可能使用的键名（按优先级排列）
+_DETAILED_KEYS = ("detailed_analysis", "deepseek_scores", "scores", "详细评分", "features", "分项评分")
+_TEXT_ANALYSIS_KEYS = ("analysis", "deepseek_analysis", "text_analysis", "分析结论", "analysis_details", "检测结论", "结论说明")
+_SOURCE_KEYS = ("source_quality", "来源质量", "domain_credibility", "域名可信度")
+_VPOINT_KEYS = ("verification_points", "claims", "验证点", "关键声明", "points")
+_CV_SOURCE_KEYS = ("sources", "verified_sources", "相关来源", "related_sources")
+_POINT_CONTENT_KEYS = ("内容", "验证内容", "content", "claim", "statement")
+_POINT_SCORE_KEYS = ("验证评分", "评分", "score", "confidence")
+_POINT_RESULTS_KEYS = ("search_results", "搜索结果", "results", "相关信息")
+_CV_SOURCE_COUNT_KEYS = ("source_count", "sources_count", "搜索结果总数", "来源数量", "相关来源数")
+_CV_SCORE_FALLBACK_KEYS = ("overall_score", "总体可信度")
+_CV_TIMELINESS_KEYS = ("timeliness", "时效性")
+_SOURCE_RELIABILITY_KEYS = ("reliability", "credibility")
+# 字符串形式的搜索结果以这些前缀开头时视为链接
+_LINK_PREFIXES = ("http://", "https://")
+_DETAILED_KEY_RANK = {key: rank for rank, key in enumerate(_DETAILED_KEYS)}
+# 嵌套字典中出现这些字段时视为AI详细评分
+_NESTED_SCORE_HINTS = frozenset(("score", "expression_pattern", "vocabulary_diversity", "人类特征"))
+
+# 从AI分析结论文本推断生成方式时使用的关键词（均为小写）
+_AI_GEN_TERMS = ("人工智能生成", "ai生成", "机器生成", "很可能是ai", "生成式ai")
+_AI_MIXED_TERMS = ("部分特征", "混合特征", "ai辅助")
+_AI_HUMAN_TERMS = ("人类特征", "人工撰写", "真实作者")
+# 关键词 -> 分组优先级（0: AI生成，1: AI辅助，2: 人类写作），用一个正则一次扫描结论文本
+_AI_TERM_GROUP = {term: group
+                  for group, terms in enumerate((_AI_GEN_TERMS, _AI_MIXED_TERMS, _AI_HUMAN_TERMS))
+                  for term in terms}
+_AI_TERM_RE = re.compile("|".join(re.escape(term) for term in _AI_TERM_GROUP))
+# DeepSeek数据中可能与AI生成内容相关的键名
+_AI_KEY_RE = re.compile(r"ai|人工智能|生成|机器", re.IGNORECASE)
+
+# 数量等级划分：(阈值, 各区间的等级)，数量为0时单独处理
+_SOURCE_LEVEL_TABLE = ((3, 5), ("有限", "适量", "充足"))
+_QUANTITY_LEVEL_TABLE = ((3, 5), ("较少", "适量", "充足"))
+_DIVERSITY_LEVEL_TABLE = ((2, 4), ("单一", "一般", "多样"))
+_AUTHORITY_LEVEL_TABLE = ((2, 4), ("一般", "较高", "高"))
+
+# 问题列表按严重程度排序（severity_rank: 0为严重，1为中等），在生成问题时写入
+_BY_SEVERITY_RANK = itemgetter("severity_rank")
+
+# 展示AI检测原始数据关键字段时跳过的键
+_SKIP_RAW_FIELDS = frozenset(("raw_data", "detail_data"))
+
+def _bounded_repr(limit: int) -> reprlib.Repr:
+    """创建按输出长度上限调整展开规模的repr，避免先完整转换大对象"""
+    bounded = reprlib.Repr()
+    bounded.maxstring = bounded.maxother = bounded.maxlong = limit * 2
+    bounded.maxdict = limit // 6 + 1
+    bounded.maxlist = bounded.maxtuple = bounded.maxset = limit // 3 + 1
+    return bounded
+
+# 展示原始数据时只需前200个字符
+_PREVIEW_LIMIT = 200
+_PREVIEW_REPR = _bounded_repr(_PREVIEW_LIMIT)
+
+# 格式化出错时最多输出的原始数据字符数
+_RAW_DUMP_LIMIT = 2048
+_RAW_DUMP_REPR = _bounded_repr(_RAW_DUMP_LIMIT)
+
 # 添加中英文翻译映射
 TRANSLATIONS = {
     # 维度名称翻译
@@ -292,10 +416,51 @@ def get_translation(text, language='zh'):
 # 添加别名使t调用get_translation
 t = get_translation
 
+@lru_cache(maxsize=32)
+def _translated_descriptions(pairs: tuple, language: str) -> dict:
+    """将(键名, 说明)表翻译为指定语言的有序字典并缓存"""
+    return {key: get_translation(desc, language) for key, desc in pairs}
+
+@lru_cache(maxsize=32)
+def _description_lines(pairs: tuple, language: str, detail_color: str, reset_color: str) -> dict:
+    """预先生成带颜色的说明行，键名 -> 说明行"""
+    return {key: f"{detail_color}    - {desc}{reset_color}"
+            for key, desc in _translated_descriptions(pairs, language).items()}
+
 def format_score(score: float) -> str:
     """格式化评分为两位小数的字符串"""
     return f"{float(score):.2f}"
 
+def _quantize_score(score) -> int:
+    """将评分量化为0-100的整数（百分制），作为描述文本缓存的键"""
+    return max(0, min(100, int(float(score) * 100)))
+
+@lru_cache(maxsize=128)
+def _credibility_summary_for(quantized: int, language: str) -> str:
+    """根据量化后的可信度评分返回摘要（结果会被缓存）"""
+    if quantized >= 80:
+        return "新闻内容可靠性高，论据充分，信息准确，来源可靠" if language == 'zh' else "The news content is highly reliable with sufficient arguments, accurate information, and reliable sources"
+    elif quantized >= 60:
+        return "新闻基本可信，但建议核实关键信息" if language == 'zh' else "The news is generally credible, but verification of key information is recommended"
+    elif quantized >= 40:
+        return "新闻可信度存在问题，建议谨慎对待" if language == 'zh' else "There are credibility issues with the news, caution is advised"
+    else:
+        return "新闻可信度严重不足，可能包含虚假或误导信息" if language == 'zh' else "The news lacks credibility significantly and may contain false or misleading information"
+
+@lru_cache(maxsize=128)
+def _ai_content_description_for(quantized: int) -> str:
+    """根据量化后的AI生成内容评分返回描述（结果会被缓存）"""
+    if quantized >= 85:
+        return t("文本高度符合人类写作特征，AI生成可能性很低")
+    elif quantized >= 70:
+        return t("文本整体符合人类写作特征，AI生成可能性较低")
+    elif quantized >= 50:
+        return t("文本有部分AI生成特征，但仍保留人类写作风格")
+    elif quantized >= 30:
+        return t("文本呈现明显的AI生成特征，可能是AI辅助创作")
+    else:
+        return t("文本极有可能由AI生成，人类写作特征极少")
+
 def get_credibility_summary(score: float, language='zh') -> str:
     """
     根据可信度评分生成简短摘要
@@ -308,18 +473,11 @@ def get_credibility_summary(score: float, language='zh') -> str:
         str: 可信度摘要
     """
     try:
-        score = float(score)
-    except (TypeError, ValueError):
+        quantized = _quantize_score(score)
+    except (TypeError, ValueError, OverflowError):
         return "无法评估：评分数据异常" if language == 'zh' else "Unable to evaluate: Abnormal score data"
     
-    if score >= 0.8:
-        return "新闻内容可靠性高，论据充分，信息准确，来源可靠" if language == 'zh' else "The news content is highly reliable with sufficient arguments, accurate information, and reliable sources"
-    elif score >= 0.6:
-        return "新闻基本可信，但建议核实关键信息" if language == 'zh' else "The news is generally credible, but verification of key information is recommended"
-    elif score >= 0.4:
-        return "新闻可信度存在问题，建议谨慎对待" if language == 'zh' else "There are credibility issues with the news, caution is advised"
-    else:
-        return "新闻可信度严重不足，可能包含虚假或误导信息" if language == 'zh' else "The news lacks credibility significantly and may contain false or misleading information"
+    return _credibility_summary_for(quantized, language)
 
 def get_ai_content_description(score: float, language='zh') -> str:
     """
@@ -333,20 +491,11 @@ def get_ai_content_description(score: float, language='zh') -> str:
         str: 描述性文本
     """
     try:
-        score = float(score)
-    except (TypeError, ValueError):
+        quantized = _quantize_score(score)
+    except (TypeError, ValueError, OverflowError):
         return t("无法评估AI生成可能性") if language == 'zh' else t("Unable to evaluate AI generation probability")
     
-    if score >= 0.85:
-        return t("文本高度符合人类写作特征，AI生成可能性很低")
-    elif score >= 0.7:
-        return t("文本整体符合人类写作特征，AI生成可能性较低")
-    elif score >= 0.5:
-        return t("文本有部分AI生成特征，但仍保留人类写作风格")
-    elif score >= 0.3:
-        return t("文本呈现明显的AI生成特征，可能是AI辅助创作")
-    else:
-        return t("文本极有可能由AI生成，人类写作特征极少")
+    return _ai_content_description_for(quantized)
 
 def get_rating_emoji(score):
     """根据评分返回对应的emoji和评级"""
@@ -361,24 +510,33 @@ def get_rating_emoji(score):
     else:
         return "❗", "差"
 
+@lru_cache(maxsize=256)
+def _render_progress_bar(filled: int, width: int) -> str:
+    """按填充格数生成进度条字符串（结果会被缓存）"""
+    if width <= _BAR_MAX_WIDTH:
+        return _BAR_FULL[:filled] + _BAR_EMPTY[:width - filled]
+    return f"{'█' * filled}{'░' * (width - filled)}"
+
 def get_progress_bar(score, width=10):
     """生成进度条"""
     if score is None:
         # 对于None值，返回空进度条
-        return f"{'░' * width}"
+        return _render_progress_bar(0, width)
     
     # 确保score是浮点数
     try:
         score_float = float(score)
     except (TypeError, ValueError):
         # 如果无法转换为浮点数，返回空进度条
-        return f"{'░' * width}"
-    
-    # 确保分数在0-1范围内
-    score_float = max(0.0, min(1.0, score_float))
+        return _render_progress_bar(0, width)
     
-    filled = int(score_float * width)
-    return f"{'█' * filled}{'░' * (width - filled)}"
+    # 确保分数在0-1范围内；按填充格数缓存，所有分数最终只对应width+1种进度条
+    if score_float <= 0.0:
+        return _render_progress_bar(0, width)
+    if score_float < 1.0:
+        return _render_progress_bar(int(score_float * width), width)
+    # 包括NaN，与原先max/min限制的结果一致，显示满进度条
+    return _render_progress_bar(width, width)
 
 def get_credibility_rating(score, language='zh'):
     """根据可信度评分返回评级"""
@@ -399,17 +557,157 @@ def get_credibility_rating(score, language='zh'):
         rating_level = "极低" if language == 'zh' else "Very Low"
         return f"{ERROR_COLOR}{rating_text}{RESET_COLOR}", rating_level
 
+def _first_present(data: dict, keys) -> Tuple[Any, Any]:
+    """按顺序返回data中第一个值非空的(键名, 值)，都不存在时返回(None, None)"""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return key, value
+    return None, None
+
+def _lookup(data: dict, keys, default=None) -> Any:
+    """按顺序返回data中第一个存在的键对应的值（等价于嵌套的dict.get链），都不存在时返回default"""
+    return next((data[key] for key in keys if key in data), default)
+
+def _find_detailed_scores(data: dict) -> Tuple[Any, Any, bool]:
+    """
+    一次遍历查找AI详细评分
+    
+    优先返回_DETAILED_KEYS中优先级最高且值非空的直接键，
+    其次返回第一个包含评分字段的嵌套字典。
+    返回(键名, 值, 是否来自嵌套字典)，都不存在时返回(None, None, False)
+    """
+    best_rank = len(_DETAILED_KEYS)
+    found_key = found_value = None
+    nested_key = nested_value = None
+    for key, value in data.items():
+        rank = _DETAILED_KEY_RANK.get(key)
+        if rank is not None and rank < best_rank and value:
+            best_rank, found_key, found_value = rank, key, value
+            if rank == 0:
+                break
+        elif nested_value is None and isinstance(value, dict) and not _NESTED_SCORE_HINTS.isdisjoint(value):
+            nested_key, nested_value = key, value
+    if found_key is not None:
+        return found_key, found_value, False
+    if nested_value is not None:
+        return nested_key, nested_value, True
+    return None, None, False
+
+def _preview(value: Any, limit: int = _PREVIEW_LIMIT) -> str:
+    """生成截断后的展示文本，字符串直接截取，其他对象使用限制规模的repr"""
+    if isinstance(value, str):
+        return value[:limit]
+    return _PREVIEW_REPR.repr(value)[:limit]
+
+def _conclusion_group(text: str):
+    """返回小写结论文本命中的优先级最高的关键词分组，未命中返回None"""
+    best = None
+    for match in _AI_TERM_RE.finditer(text):
+        group = _AI_TERM_GROUP[match.group()]
+        if group == 0:
+            return 0
+        if best is None or group < best:
+            best = group
+    return best
+
+def _count_search_results(points: list) -> Tuple[int, int]:
+    """
+    一次遍历统计验证点的搜索结果
+    
+    返回:
+        Tuple[int, int]: (没有搜索结果的验证点数, 搜索结果总数)
+    """
+    no_result_count = 0
+    search_results_count = 0
+    for p in points:
+        if not isinstance(p, dict):
+            continue
+        result_count = p.get("搜索结果数量", 0)
+        if result_count == 0:
+            no_result_count += 1
+        hits = p.get("搜索结果")
+        if isinstance(hits, int):
+            search_results_count += hits
+        elif isinstance(result_count, int):
+            search_results_count += result_count
+    return no_result_count, search_results_count
+
+def _ellipsize(text: str, limit: int = 100, head: int = 40, tail: int = 40) -> str:
+    """超过limit的文本只保留开头head个和结尾tail个字符，中间用省略号连接"""
+    return text if len(text) <= limit else f"{text[:head]}...{text[-tail:]}"
+
+def _mentions_cross_validation(data: Any) -> bool:
+    """深度遍历键和字符串值，发现"validation"或"交叉验证"时立即返回，不需要把整个结果转换为字符串"""
+    stack = [data]
+    seen = set()
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            if "交叉验证" in item or "validation" in item.lower():
+                return True
+        elif isinstance(item, (dict, list, tuple, set)):
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+            if isinstance(item, dict):
+                stack.extend(item.keys())
+                stack.extend(item.values())
+            else:
+                stack.extend(item)
+    return False
+
+def _write_lines(lines: list) -> None:
+    """将一个分节收集的多行输出合并为一次写入"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+_SCORE_COLORS = (ERROR_COLOR, WARNING_COLOR, SUCCESS_COLOR)
+
+def _score_color(score, hi=0.8, mid=0.6, colors=_SCORE_COLORS):
+    """根据评分阈值选择颜色：>=hi为成功色，>=mid为警告色，否则为错误色"""
+    return colors[bisect_right((mid, hi), score)]
+
+def _ai_probability(human_score: float) -> float:
+    """由人类写作特征评分换算AI生成概率，并限制在0-1之间"""
+    probability = 1.0 - human_score
+    return 0.0 if probability < 0.0 else (1.0 if probability > 1.0 else probability)
+
+def _ai_probability_color(probability, colors=_SCORE_COLORS):
+    """AI生成概率越低越好：<=0.3为成功色，<=0.5为警告色，否则为错误色"""
+    return colors[2] if probability <= 0.3 else (colors[1] if probability <= 0.5 else colors[0])
+
+@lru_cache(maxsize=64)
+def _trust_level_index(domain_trust: str) -> int:
+    """将域名可信度文本映射为颜色下标：含"高"为2，含"中"为1，否则为0"""
+    if "高" in domain_trust:
+        return 2
+    return 1 if "中" in domain_trust else 0
+
+@lru_cache(maxsize=1024)
+def _coerce_score(score: Any) -> Tuple[float, bool]:
+    """按数值缓存评分转换结果，返回(限制到0-1后的评分, 是否在范围内)"""
+    score_float = float(score)
+    if 0 <= score_float <= 1:
+        return score_float, True
+    return max(0.0, min(1.0, score_float)), False
+
 def validate_score(score: Any, source: str = "未知") -> float:
     """验证并转换评分"""
+    # 快速路径：绝大多数调用传入的已是0-1范围内的float
+    if type(score) is float and 0.0 <= score <= 1.0:
+        return score
+    
+    # 来源标签只用于日志，缓存只以评分值为键；不可哈希的值同样按转换失败处理
     try:
-        score_float = float(score)
-        if not 0 <= score_float <= 1:
-            logger.warning(f"评分超出范围[0-1]: {score_float} (来源: {source})")
-            return max(0.0, min(1.0, score_float))
-        return score_float
+        score_float, in_range = _coerce_score(score)
     except (TypeError, ValueError) as e:
-        logger.error(f"评分转换失败: {score} (来源: {source}) - {str(e)}")
+        logger.error("评分转换失败: %s (来源: %s) - %s", score, source, e)
         raise ValueError(f"无效的评分值: {score}")
+    
+    if not in_range:
+        logger.warning("评分超出范围[0-1]: %s (来源: %s)", float(score), source)
+    return score_float
 
 def validate_data(data: Dict[str, Any], required_fields: list, context: str = "") -> bool:
     """验证数据完整性"""
@@ -707,6 +1005,7 @@ def analyze_problems(result: dict, total_score: float, main_scores: dict, cross_
     if total_score < 0.4:
         problems.append({
             "severity": t("严重"),
+            "severity_rank": 0,
             "type": t("总体可信度"),
             "description": t("新闻整体可信度极低") + f" ({total_score:.1%})",
             "suggestion": t("建议谨慎对待该新闻内容，需要大量额外验证") if language == 'zh' else "It is recommended to treat this news content with caution and requires substantial additional verification",
@@ -715,6 +1014,7 @@ def analyze_problems(result: dict, total_score: float, main_scores: dict, cross_
     elif total_score < 0.6:
         problems.append({
             "severity": t("中等"),
+            "severity_rank": 1,
             "type": t("总体可信度"),
             "description": t("新闻可信度较低") + f" ({total_score:.1%})",
             "suggestion": t("建议进一步核实关键信息") if language == 'zh' else "It is recommended to further verify key information",
@@ -742,13 +1042,15 @@ def analyze_problems(result: dict, total_score: float, main_scores: dict, cross_
         if original_dim and original_dim in main_scores:
             score = float(main_scores[original_dim])
             if score < threshold:
-                severity = t("严重") if score < 0.4 else t("中等")
+                severe = score < 0.4
+                severity = t("严重") if severe else t("中等")
                 problems.append({
                     "severity": severity,
+                    "severity_rank": 0 if severe else 1,
                     "type": dim,
                     "description": f"{dim}{t('评分过低')} ({score:.1%})",
                     "suggestion": suggestion,
-                    "color": ERROR_COLOR if score < 0.4 else WARNING_COLOR
+                    "color": ERROR_COLOR if severe else WARNING_COLOR
                 })
     
     # 3. 分析交叉验证
@@ -789,45 +1091,24 @@ def analyze_problems(result: dict, total_score: float, main_scores: dict, cross_
         # 尝试获取验证点列表和搜索结果计数
         if "验证点" in cross_validation_data and isinstance(cross_validation_data["验证点"], list):
             verification_points = cross_validation_data["验证点"]
-            # 计算没有搜索结果的验证点数量
-            no_result_count = sum(1 for p in verification_points if isinstance(p, dict) and p.get("搜索结果数量", 0) == 0)
+            # 一次遍历计算没有搜索结果的验证点数量和搜索结果总数
+            no_result_count, point_results = _count_search_results(verification_points)
+            search_results_count += point_results
             logger.info(f"从验证点中发现无搜索结果的点数: {no_result_count}")
-            
-            # 尝试从验证点中获取搜索结果总数
-            for p in verification_points:
-                if isinstance(p, dict):
-                    if "搜索结果" in p and isinstance(p["搜索结果"], int):
-                        search_results_count += p["搜索结果"]
-                    elif "搜索结果数量" in p and isinstance(p["搜索结果数量"], int):
-                        search_results_count += p["搜索结果数量"]
                         
         elif "verification_points" in cross_validation_data and isinstance(cross_validation_data["verification_points"], list):
             verification_points = cross_validation_data["verification_points"]
-            # 计算没有搜索结果的验证点数量
-            no_result_count = sum(1 for p in verification_points if isinstance(p, dict) and p.get("搜索结果数量", 0) == 0)
+            # 一次遍历计算没有搜索结果的验证点数量和搜索结果总数
+            no_result_count, point_results = _count_search_results(verification_points)
+            search_results_count += point_results
             logger.info(f"从verification_points中发现无搜索结果的点数: {no_result_count}")
-            
-            # 尝试从验证点中获取搜索结果总数
-            for p in verification_points:
-                if isinstance(p, dict):
-                    if "搜索结果" in p and isinstance(p["搜索结果"], int):
-                        search_results_count += p["搜索结果"]
-                    elif "搜索结果数量" in p and isinstance(p["搜索结果数量"], int):
-                        search_results_count += p["搜索结果数量"]
                         
         elif "claims" in cross_validation_data and isinstance(cross_validation_data["claims"], list):
             verification_points = cross_validation_data["claims"]
-            # 计算没有搜索结果的验证点数量
-            no_result_count = sum(1 for p in verification_points if isinstance(p, dict) and p.get("搜索结果数量", 0) == 0)
+            # 一次遍历计算没有搜索结果的验证点数量和搜索结果总数
+            no_result_count, point_results = _count_search_results(verification_points)
+            search_results_count += point_results
             logger.info(f"从claims中发现无搜索结果的点数: {no_result_count}")
-            
-            # 尝试从验证点中获取搜索结果总数
-            for p in verification_points:
-                if isinstance(p, dict):
-                    if "搜索结果" in p and isinstance(p["搜索结果"], int):
-                        search_results_count += p["搜索结果"]
-                    elif "搜索结果数量" in p and isinstance(p["搜索结果数量"], int):
-                        search_results_count += p["搜索结果数量"]
         
         # 如果搜索结果数大于0但来源计数为0，使用搜索结果数作为来源计数的估计
         if search_results_count > 0 and source_count == 0:
@@ -838,6 +1119,7 @@ def analyze_problems(result: dict, total_score: float, main_scores: dict, cross_
         if source_count < 2 and search_results_count < 3:
             problems.append({
                 "severity": "中等",
+                "severity_rank": 1,
                 "type": "交叉验证",
                 "description": f"缺乏足够的交叉验证来源 (仅{source_count}个)",
                 "suggestion": "建议寻找更多独立来源验证信息",
@@ -849,6 +1131,7 @@ def analyze_problems(result: dict, total_score: float, main_scores: dict, cross_
             verification_points_count = len(verification_points) if verification_points else 0
             problems.append({
                 "severity": "中等",
+                "severity_rank": 1,
                 "type": "交叉验证完整性",
                 "description": f"{no_result_count}个验证点未找到相关信息 (共{verification_points_count}个验证点)",
                 "suggestion": "建议针对这些特定信息点进行额外验证",
@@ -860,6 +1143,7 @@ def analyze_problems(result: dict, total_score: float, main_scores: dict, cross_
         if isinstance(credibility, str) and ("低可信" in credibility or "不可信" in credibility):
             problems.append({
                 "severity": "严重",
+                "severity_rank": 0,
                 "type": "交叉验证",
                 "description": "交叉验证来源可信度低",
                 "suggestion": "建议寻找更权威的信息来源",
@@ -871,7 +1155,7 @@ def analyze_problems(result: dict, total_score: float, main_scores: dict, cross_
 def print_problems_section(problems: list):
     """打印问题分析部分"""
     print(f"\n{SUBHEADER_COLOR}四、问题点分析{RESET_COLOR}")
-    print(f"{DETAIL_COLOR}{'━' * 70}{RESET_COLOR}")
+    print(f"{DETAIL_COLOR}{_RULE_THIN}{RESET_COLOR}")
     
     if not problems:
         print(f"{SUCCESS_COLOR}  ✓ 未发现明显问题{RESET_COLOR}")
@@ -879,14 +1163,16 @@ def print_problems_section(problems: list):
         return
     
     # 按严重程度排序（严重 > 中等）
-    problems.sort(key=lambda x: 0 if x["severity"] == "严重" else 1)
+    problems.sort(key=_BY_SEVERITY_RANK)
     
+    # 循环内使用局部变量代替全局颜色常量
+    reset = RESET_COLOR
     for i, problem in enumerate(problems, 1):
         color = problem["color"]
-        print(f"\n{color}{i}. {problem['type']}问题:{RESET_COLOR}")
-        print(f"{color}  ⚠️ 严重性：{problem['severity']}{RESET_COLOR}")
-        print(f"{color}    - {problem['description']}{RESET_COLOR}")
-        print(f"{color}    - 建议：{problem['suggestion']}{RESET_COLOR}")
+        print(f"\n{color}{i}. {problem['type']}问题:{reset}")
+        print(f"{color}  ⚠️ 严重性：{problem['severity']}{reset}")
+        print(f"{color}    - {problem['description']}{reset}")
+        print(f"{color}    - 建议：{problem['suggestion']}{reset}")
 
 def print_formatted_result(result: Dict[str, Any], colored_output: bool = True, language: str = 'zh') -> None:
     """
@@ -897,6 +1183,17 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         colored_output: 是否启用彩色输出
         language: 输出语言 ('zh': 中文, 'en': 英文)
     """
+    # 关闭彩色输出（或设置了NO_COLOR环境变量）时，用空字符串遮蔽颜色常量
+    use_color = colored_output and not os.environ.get("NO_COLOR")
+    (TITLE_COLOR, HEADER_COLOR, SUBHEADER_COLOR, SECTION_COLOR, DETAIL_COLOR,
+     WARNING_COLOR, ERROR_COLOR, SUCCESS_COLOR, INFO_COLOR, NEUTRAL_COLOR,
+     RESET_COLOR) = _COLOR_PALETTE if use_color else _PLAIN_PALETTE
+    header_banner = _HEADER_BANNER if use_color else _PLAIN_HEADER_BANNER
+    score_colors = (ERROR_COLOR, WARNING_COLOR, SUCCESS_COLOR)
+    score_color_for = partial(_score_color, colors=score_colors)
+    contribution_color_for = partial(_score_color, hi=25, mid=15, colors=(NEUTRAL_COLOR, DETAIL_COLOR, SUCCESS_COLOR))
+    ai_prob_color_for = partial(_ai_probability_color, colors=score_colors)
+    
     if not result:
         if language == 'zh':
             print(f"{ERROR_COLOR}错误: 没有可显示的结果{RESET_COLOR}")
@@ -909,8 +1206,12 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         def t(text):
             return get_translation(text, language)
         
+        # DEBUG未开启时跳过大对象的字符串化和循环内的调试日志格式化
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
         logger.info("开始格式化分析结果")
-        logger.debug(f"输入数据: {result}")
+        if debug_enabled:
+            logger.debug(f"输入数据: {result}")
         
         # 验证输入数据
         if not isinstance(result, dict):
@@ -922,7 +1223,12 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         # 获取主要评分数据
         main_scores = {}
         scoring_details = result.get("评分详情", {})
-        deepseek_data = result.get("原始分析数据", {}).get("deepseek_full_response", {})
+        # 原始分析数据只取一次，后续各部分共用
+        raw_analysis = result.get("原始分析数据") or {}
+        deepseek_data = raw_analysis.get("deepseek_full_response", {}) if isinstance(raw_analysis, dict) else {}
+        if not isinstance(deepseek_data, dict):
+            logger.warning("DeepSeek数据格式无效")
+            deepseek_data = {}
         
         # 提取AI生成内容检测数据
         ai_content_data = None
@@ -950,7 +1256,8 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                         break
         
         # 记录找到的AI生成内容检测数据
-        logger.debug(f"提取的AI生成内容检测数据: {ai_content_data}")
+        if debug_enabled:
+            logger.debug(f"提取的AI生成内容检测数据: {ai_content_data}")
         
         # 更全面地尝试提取交叉验证数据
         cross_validation_data = None
@@ -991,12 +1298,13 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                 logger.info("从分散字段构建交叉验证数据")
         
         # 记录找到的交叉验证数据
-        logger.debug(f"提取的交叉验证数据: {cross_validation_data}")
+        if debug_enabled:
+            logger.debug(f"提取的交叉验证数据: {cross_validation_data}")
         
         # 从多个来源收集评分数据
         if isinstance(scoring_details, dict):
             for key, value in scoring_details.items():
-                if key.startswith(("内容真实性", "信息准确性", "来源可靠性", "引用质量", "语言客观性", "逻辑连贯性")):
+                if key.partition("_")[0] in _MAIN_DIMENSION_SET:
                     clean_key = key.split("_")[-1] if "_" in key else key
                     main_scores[clean_key] = value
         
@@ -1023,12 +1331,14 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         
         # 获取评级
         rating_text, rating_level = get_credibility_rating(total_score)
+        if not use_color:
+            rating_text = _ANSI_ESCAPE_RE.sub("", rating_text)
         logger.debug(f"可信度评级: {rating_text} (级别: {rating_level})")
         
         # 顶部横幅
-        print(f"\n{HEADER_COLOR}{'=' * 70}{RESET_COLOR}")
+        print(f"\n{header_banner}")
         print(f"{HEADER_COLOR}{t('新闻可信度分析报告'):^70}{RESET_COLOR}")
-        print(f"{HEADER_COLOR}{'=' * 70}{RESET_COLOR}")
+        print(header_banner)
         
         # 总评部分
         print(f"\n{TITLE_COLOR}{'▓' * 70}{RESET_COLOR}")
@@ -1081,7 +1391,7 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                     contribution = score * weight * 100 / total_score_pct  # 贡献比例
                     
                     # 根据贡献大小设置颜色
-                    color = SUCCESS_COLOR if contribution >= 25 else (DETAIL_COLOR if contribution >= 15 else NEUTRAL_COLOR)
+                    color = contribution_color_for(contribution)
                     
                     # 显示维度评分和贡献
                     dimension_desc = dimension_display.get(dimension_translated, dimension_translated)
@@ -1096,7 +1406,7 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                         score = float(main_scores[dimension])
                         contribution = score * weight * 100 / total_score_pct
                         
-                        color = SUCCESS_COLOR if contribution >= 25 else (DETAIL_COLOR if contribution >= 15 else NEUTRAL_COLOR)
+                        color = contribution_color_for(contribution)
                         dimension_desc = dimension_display.get(dimension, dimension)
                         print(f"{color}  • {dimension}: {score:.2f} × 权重{weight:.2f} = {score*weight:.2f} (贡献{contribution:.1f}%){RESET_COLOR}")
                         print(f"{NEUTRAL_COLOR}    - {dimension_desc}{RESET_COLOR}")
@@ -1114,7 +1424,7 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                             logger.info(f"使用推导的分数: {cv_score}")
                         
                         contribution = cv_score * weight * 100 / total_score_pct
-                        color = SUCCESS_COLOR if contribution >= 25 else (DETAIL_COLOR if contribution >= 15 else NEUTRAL_COLOR)
+                        color = contribution_color_for(contribution)
                         
                         print(f"{color}  • 交叉验证: {cv_score:.2f} × 权重{weight:.2f} = {cv_score*weight:.2f} (贡献{contribution:.1f}%){RESET_COLOR}")
                         print(f"{NEUTRAL_COLOR}    - 外部信息的验证确认{RESET_COLOR}")
@@ -1127,7 +1437,7 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         
         # 一、内容真实性与准确性分析
         print(f"\n{SUBHEADER_COLOR}{('一、' if language == 'zh' else '1. ')}{t('内容真实性与准确性分析')}{RESET_COLOR}")
-        print(f"{DETAIL_COLOR}{'━' * 70}{RESET_COLOR}")
+        print(f"{DETAIL_COLOR}{_RULE_THIN}{RESET_COLOR}")
         
         # AI生成内容检测部分
         print(f"\n{SECTION_COLOR}1. {t('AI生成内容检测')}:{RESET_COLOR}")
@@ -1149,23 +1459,24 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                 if valid_scores:
                     avg_score = sum(valid_scores) / len(valid_scores)
                     ai_score = avg_score  # 设置ai_score
-                    score_color = SUCCESS_COLOR if avg_score >= 0.8 else (WARNING_COLOR if avg_score >= 0.6 else ERROR_COLOR)
+                    score_color = score_color_for(avg_score)
                     
                     print(f"{score_color}  • 人类写作特征评分: {avg_score:.2f} {get_progress_bar(avg_score)}{RESET_COLOR}")
                     print(f"{DETAIL_COLOR}    - {get_ai_content_description(avg_score)}{RESET_COLOR}")
                     
                     # 显示AI生成概率
-                    ai_probability = max(0, min(1, 1 - avg_score))
-                    ai_prob_color = SUCCESS_COLOR if ai_probability <= 0.3 else (WARNING_COLOR if ai_probability <= 0.5 else ERROR_COLOR)
+                    ai_probability = _ai_probability(avg_score)
+                    ai_prob_color = ai_prob_color_for(ai_probability)
                     print(f"{ai_prob_color}  • AI生成概率: {ai_probability:.2f} {get_progress_bar(ai_probability)}{RESET_COLOR}")
                     
                     # 显示详细特征评分
-                    print(f"\n{SECTION_COLOR}  {t('AI特征详细分析')}:{RESET_COLOR}")
+                    lines = [f"\n{SECTION_COLOR}  {t('AI特征详细分析')}:{RESET_COLOR}"]
                     for key, score in detailed_scores.items():
                         if isinstance(score, (int, float)) and 0 <= float(score) <= 1:
                             score_float = float(score)
-                            score_color = SUCCESS_COLOR if score_float >= 0.7 else (WARNING_COLOR if score_float >= 0.5 else ERROR_COLOR)
-                            print(f"{score_color}    • {t(key)}: {score_float:.2f} {get_progress_bar(score_float)}{RESET_COLOR}")
+                            score_color = score_color_for(score_float, 0.7, 0.5)
+                            lines.append(f"{score_color}    • {t(key)}: {score_float:.2f} {get_progress_bar(score_float)}{RESET_COLOR}")
+                    _write_lines(lines)
             except Exception as e:
                 logger.error(f"提取AI生成内容评分时出错: {str(e)}")
                 ai_score = None
@@ -1215,13 +1526,13 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                 try:
                     ai_score_float = validate_score(ai_score, "AI生成内容评分")
                     # 注意：这里评分越高，表示越像人类写作，AI生成可能性越低
-                    score_color = SUCCESS_COLOR if ai_score_float >= 0.7 else (WARNING_COLOR if ai_score_float >= 0.5 else ERROR_COLOR)
+                    score_color = score_color_for(ai_score_float, 0.7, 0.5)
                     print(f"{score_color}  • 人类写作特征评分: {ai_score_float:.2f} {get_progress_bar(ai_score_float)}{RESET_COLOR}")
                     print(f"{DETAIL_COLOR}  • {get_ai_content_description(ai_score_float)}{RESET_COLOR}")
                     
                     # 添加AI生成概率
-                    ai_probability = max(0, min(1, 1 - ai_score_float))
-                    ai_prob_color = SUCCESS_COLOR if ai_probability <= 0.3 else (WARNING_COLOR if ai_probability <= 0.5 else ERROR_COLOR)
+                    ai_probability = _ai_probability(ai_score_float)
+                    ai_prob_color = ai_prob_color_for(ai_probability)
                     
                     # 在英文模式下使用百分比格式，中文模式下保留原格式
                     if language == 'zh':
@@ -1246,19 +1557,20 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                         
                         # 尝试从结论中推断AI生成可能性
                         if isinstance(conclusion, str):
-                            if any(term in conclusion.lower() for term in ["人工智能生成", "ai生成", "机器生成", "很可能是ai", "生成式ai"]):
+                            group = _conclusion_group(conclusion.lower())
+                            if group == 0:
                                 print(f"{WARNING_COLOR}  • {t('推断结果')}: {t('文本很可能由AI生成')}{RESET_COLOR}")
-                            elif any(term in conclusion.lower() for term in ["部分特征", "混合特征", "ai辅助"]):
+                            elif group == 1:
                                 print(f"{WARNING_COLOR}  • {t('推断结果')}: {t('文本可能是AI辅助创作')}{RESET_COLOR}")
-                            elif any(term in conclusion.lower() for term in ["人类特征", "人工撰写", "真实作者"]):
+                            elif group == 2:
                                 print(f"{SUCCESS_COLOR}  • {t('推断结果')}: {t('文本具有较强的人类写作特征')}{RESET_COLOR}")
                     else:
                         print(f"{WARNING_COLOR}  • {t('未找到明确的AI生成内容评分或结论')}{RESET_COLOR}")
                         print(f"{DETAIL_COLOR}  • {t('以下为原始AI检测数据的关键字段')}:{RESET_COLOR}")
                         # 显示关键字段，帮助用户理解数据
-                        key_fields = [k for k in ai_content_data.keys() if k not in ["raw_data", "detail_data"]][:5]
+                        key_fields = list(islice((k for k in ai_content_data if k not in _SKIP_RAW_FIELDS), 5))
                         for k in key_fields:
-                            print(f"{DETAIL_COLOR}    - {k}: {str(ai_content_data[k])[:50]}...{RESET_COLOR}")
+                            print(f"{DETAIL_COLOR}    - {k}: {_preview(ai_content_data[k], 50)}...{RESET_COLOR}")
                 except Exception as e:
                     logger.error(f"处理AI分析结论推断时出错: {str(e)}")
                     print(f"{ERROR_COLOR}  • 处理AI分析结论时出错: {str(e)}{RESET_COLOR}")
@@ -1266,101 +1578,71 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                 # 添加AI详细分析部分，放在if/else的外部，因为无论是否找到ai_score都应尝试分析详细特征
                 try:
                     # 尝试提取详细的特征分析
-                    detailed_scores = None
                     # 尝试从不同的可能字段名获取详细评分
-                    for key in ["detailed_analysis", "deepseek_scores", "scores", "详细评分", "features", "分项评分"]:
-                        if key in ai_content_data and ai_content_data[key]:
-                            detailed_scores = ai_content_data[key]
-                            logger.info(f"找到AI生成内容详细评分，键名: {key}")
-                            break
+                    # 直接键优先，没找到时使用嵌套字典，二者在同一次遍历中查找
+                    key, detailed_scores, nested = _find_detailed_scores(ai_content_data)
+                    if nested:
+                        logger.info(f"从嵌套字典中找到AI生成内容详细评分: {key}")
+                    elif key:
+                        logger.info(f"找到AI生成内容详细评分，键名: {key}")
                     
-                    # 如果直接键没找到，尝试在嵌套字典中查找
-                    if not detailed_scores:
-                        for key, value in ai_content_data.items():
-                            if isinstance(value, dict) and any(sk in value for sk in ["score", "expression_pattern", "vocabulary_diversity", "人类特征"]):
-                                detailed_scores = value
-                                logger.info(f"从嵌套字典中找到AI生成内容详细评分: {key}")
-                                break
+                    # 一次遍历收集0-1范围内的详细特征评分，计算平均值和统计有效项时共用
+                    feature_scores = []
+                    feature_total = 0.0
+                    if detailed_scores and isinstance(detailed_scores, dict):
+                        for key, value in detailed_scores.items():
+                            if isinstance(value, (int, float)):
+                                score_float = float(value)
+                                if 0 <= score_float <= 1:
+                                    feature_scores.append((key, score_float))
+                                    feature_total += score_float
                     
                     # 如果找到了详细特征评分，但没有找到总体评分，则计算平均值作为总体评分
-                    if detailed_scores and isinstance(detailed_scores, dict) and ai_score is None:
-                        feature_scores = []
-                        for key, value in detailed_scores.items():
-                            try:
-                                if isinstance(value, (int, float)) and 0 <= float(value) <= 1:
-                                    feature_scores.append(float(value))
-                            except:
-                                pass
+                    if feature_scores and ai_score is None:
+                        # 计算平均值作为总体评分
+                        avg_score = feature_total / len(feature_scores)
+                        ai_score = avg_score
+                        logger.info(f"从详细特征评分计算出总体评分: {ai_score:.2f}")
                         
-                        if feature_scores:
-                            # 计算平均值作为总体评分
-                            avg_score = sum(feature_scores) / len(feature_scores)
-                            ai_score = avg_score
-                            logger.info(f"从详细特征评分计算出总体评分: {ai_score:.2f}")
-                            
-                            # 显示计算得出的总体评分
-                            ai_score_float = avg_score
-                            score_color = SUCCESS_COLOR if ai_score_float >= 0.7 else (WARNING_COLOR if ai_score_float >= 0.5 else ERROR_COLOR)
-                            print(f"{score_color}  • {t('人类写作特征评分')}: {ai_score_float:.2f} {get_progress_bar(ai_score_float)}{RESET_COLOR}")
-                            print(f"{DETAIL_COLOR}  • {get_ai_content_description(ai_score_float, language)}{RESET_COLOR}")
-                            
-                            # 添加AI生成概率
-                            ai_probability = max(0, min(1, 1 - ai_score_float))
-                            ai_prob_color = SUCCESS_COLOR if ai_probability <= 0.3 else (WARNING_COLOR if ai_probability <= 0.5 else ERROR_COLOR)
-                            
-                            # 在英文模式下使用百分比格式，中文模式下保留原格式
-                            if language == 'zh':
-                                print(f"{ai_prob_color}  • {t('AI生成概率')}: {ai_probability:.1%}{RESET_COLOR}")
-                            else:
-                                print(f"{ai_prob_color}  • {t('AI生成概率')}: {ai_probability*100:.1f}%{RESET_COLOR}")
+                        # 显示计算得出的总体评分
+                        ai_score_float = avg_score
+                        score_color = score_color_for(ai_score_float, 0.7, 0.5)
+                        print(f"{score_color}  • {t('人类写作特征评分')}: {ai_score_float:.2f} {get_progress_bar(ai_score_float)}{RESET_COLOR}")
+                        print(f"{DETAIL_COLOR}  • {get_ai_content_description(ai_score_float, language)}{RESET_COLOR}")
+                        
+                        # 添加AI生成概率
+                        ai_probability = _ai_probability(ai_score_float)
+                        ai_prob_color = ai_prob_color_for(ai_probability)
+                        
+                        # 在英文模式下使用百分比格式，中文模式下保留原格式
+                        if language == 'zh':
+                            print(f"{ai_prob_color}  • {t('AI生成概率')}: {ai_probability:.1%}{RESET_COLOR}")
+                        else:
+                            print(f"{ai_prob_color}  • {t('AI生成概率')}: {ai_probability*100:.1f}%{RESET_COLOR}")
                     
                     # 显示详细特征分析
                     if detailed_scores and isinstance(detailed_scores, dict):
-                        print(f"\n{SECTION_COLOR}  {t('AI特征详细分析')}:{RESET_COLOR}")
+                        lines = [f"\n{SECTION_COLOR}  {t('AI特征详细分析')}:{RESET_COLOR}"]
                         
-                        # 定义常见评分项的描述
-                        score_descriptions = {
-                            "expression_pattern": t("表达模式 (句式结构的人类特征)"),
-                            "vocabulary_diversity": t("词汇多样性 (用词丰富度的人类特征)"),
-                            "sentence_variation": t("句子变化 (句式变化多样性的人类特征)"),
-                            "context_coherence": t("上下文连贯性 (逻辑流畅度的人类特征)"),
-                            "human_traits": t("人类特征 (文本中的人类思维特征)"),
-                            "表达模式": t("表达模式 (句式结构的人类特征)"),
-                            "词汇多样性": t("词汇多样性 (用词丰富度的人类特征)"),
-                            "句子变化": t("句子变化 (句式变化多样性的人类特征)"),
-                            "上下文连贯性": t("上下文连贯性 (逻辑流畅度的人类特征)"),
-                            "人类特征": t("人类特征 (文本中的人类思维特征)")
-                        }
+                        # 常见评分项的描述
+                        score_descriptions = _translated_descriptions(_AI_FEATURE_DESCRIPTIONS, language)
                         
-                        # 计算有效评分项
-                        valid_scores = 0
-                        for key, value in detailed_scores.items():
-                            try:
-                                if isinstance(value, (int, float)) and 0 <= float(value) <= 1:
-                                    valid_scores += 1
-                            except:
-                                pass
-                        
-                        if valid_scores > 0:
+                        if feature_scores:
+                            # 数值类型经validate_score只会被限制到0-1范围，不会抛出异常
                             for key, value in detailed_scores.items():
-                                try:
-                                    if isinstance(value, (int, float)):
-                                        score = validate_score(value, f"AI生成内容.{key}")
-                                        score_color = SUCCESS_COLOR if score >= 0.7 else (WARNING_COLOR if score >= 0.5 else ERROR_COLOR)
-                                        key_description = score_descriptions.get(key, key)
-                                        print(f"{score_color}    • {key_description}: {score:.2f} {get_progress_bar(score)}{RESET_COLOR}")
-                                except ValueError:
-                                    logger.warning(f"AI生成内容详细评分'{key}'无效: {value}")
+                                if isinstance(value, (int, float)):
+                                    score = validate_score(value, f"AI生成内容.{key}")
+                                    score_color = score_color_for(score, 0.7, 0.5)
+                                    key_description = score_descriptions.get(key, key)
+                                    lines.append(f"{score_color}    • {key_description}: {score:.2f} {get_progress_bar(score)}{RESET_COLOR}")
                         else:
-                            print(f"{WARNING_COLOR}    • 未找到有效的详细评分项{RESET_COLOR}")
+                            lines.append(f"{WARNING_COLOR}    • 未找到有效的详细评分项{RESET_COLOR}")
+                        _write_lines(lines)
                     
                     # 尝试提取文本分析结论
-                    text_analysis = None
-                    for key in ["analysis", "deepseek_analysis", "text_analysis", "分析结论", "analysis_details", "检测结论", "结论说明"]:
-                        if key in ai_content_data and ai_content_data[key]:
-                            text_analysis = ai_content_data[key]
-                            logger.info(f"找到AI生成内容文本分析，键名: {key}")
-                            break
+                    key, text_analysis = _first_present(ai_content_data, _TEXT_ANALYSIS_KEYS)
+                    if key:
+                        logger.info(f"找到AI生成内容文本分析，键名: {key}")
                     
                     if text_analysis:
                         print(f"\n{SECTION_COLOR}  分析结论:{RESET_COLOR}")
@@ -1374,7 +1656,7 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                     print(f"{ERROR_COLOR}  • AI生成内容检测数据处理错误: {str(e)}{RESET_COLOR}")
                     # 尝试直接显示原始数据
                     try:
-                        print(f"{DETAIL_COLOR}  • 原始AI生成内容数据: {str(ai_content_data)[:200]}...{RESET_COLOR}")
+                        print(f"{DETAIL_COLOR}  • 原始AI生成内容数据: {_preview(ai_content_data)}...{RESET_COLOR}")
                     except:
                         pass
         else:
@@ -1382,23 +1664,17 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
             ai_related_info = {}
             if isinstance(deepseek_data, dict):
                 # 搜索deepseek_data中可能与AI相关的键
-                for key, value in deepseek_data.items():
-                    if any(term in key.lower() for term in ["ai", "人工智能", "生成", "机器"]):
-                        ai_related_info[key] = value
+                ai_related_info = {key: value for key, value in deepseek_data.items() if _AI_KEY_RE.search(key)}
             
             if ai_related_info:
                 print(f"{WARNING_COLOR}  • 未找到标准格式的AI生成内容检测数据，但发现相关信息{RESET_COLOR}")
-                print(f"{DETAIL_COLOR}  • 相关信息: {str(ai_related_info)[:200]}...{RESET_COLOR}")
+                print(f"{DETAIL_COLOR}  • 相关信息: {_preview(ai_related_info)}...{RESET_COLOR}")
             else:
                 print(f"{WARNING_COLOR}  • 未找到AI生成内容检测数据{RESET_COLOR}")
                 print(f"{DETAIL_COLOR}  • 建议：启用AI生成内容检测功能以评估文本真实性{RESET_COLOR}")
         
-        # 2. 安全获取和处理 DeepSeek 数据
+        # 2. DeepSeek 数据已在开头获取并校验
         logger.debug("开始处理DeepSeek分析数据")
-        deepseek_data = result.get("原始分析数据", {}).get("deepseek_full_response", {})
-        if not isinstance(deepseek_data, dict):
-            logger.warning("DeepSeek数据格式无效")
-            deepseek_data = {}
         
         # 3. 处理主要评分
         logger.debug("开始处理主要评分指标")
@@ -1407,11 +1683,11 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         # 首先尝试从评分详情中获取
         if isinstance(scoring_details, dict):
             for key, value in scoring_details.items():
-                if key.startswith(("内容真实性", "信息准确性", "来源可靠性", "引用质量", "语言客观性", "逻辑连贯性")):
+                if key.partition("_")[0] in _MAIN_DIMENSION_SET:
                     clean_key = key.split("_")[-1] if "_" in key else key
                     try:
                         main_scores[clean_key] = validate_score(value, f"评分详情.{key}")
-                        logger.debug(f"从评分详情获取到{clean_key}评分: {main_scores[clean_key]}")
+                        logger.debug("从评分详情获取到%s评分: %s", clean_key, main_scores[clean_key])
                     except ValueError:
                         logger.warning(f"评分详情中的{key}评分无效: {value}")
                         continue
@@ -1422,71 +1698,58 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
             main_scores = deepseek_data.get("各大类评分", {})
         
         if main_scores and isinstance(main_scores, dict):
-            print(f"\n{SECTION_COLOR}2. 主要评分指标:{RESET_COLOR}")
+            lines = [f"\n{SECTION_COLOR}2. 主要评分指标:{RESET_COLOR}"]
             try:
                 # 处理主要维度评分
-                dimensions = {
-                    "内容真实性": t("新闻内容与事实的符合程度"),
-                    "信息准确性": t("信息的精确性和完整性"),
-                    "来源可靠性": t("信息来源的权威性和可信度"),
-                    "引用质量": t("引用的准确性和相关性"),
-                    "语言客观性": t("语言表达的中立性和客观性"),
-                    "逻辑连贯性": t("内容的逻辑性和连贯性")
-                }
-                
-                for dim, desc in dimensions.items():
+                dimension_lines = _description_lines(_DIMENSION_DESCRIPTIONS, language, DETAIL_COLOR, RESET_COLOR)
+                for dim, desc_line in dimension_lines.items():
                     score = main_scores.get(dim)
                     if score is not None:
                         try:
                             score_float = validate_score(score, f"主要评分.{dim}")
-                            color = SUCCESS_COLOR if score_float >= 0.8 else (WARNING_COLOR if score_float >= 0.6 else ERROR_COLOR)
-                            print(f"{color}  • {t(dim)}: {score_float:.2f} {get_progress_bar(score_float)}{RESET_COLOR}")
-                            print(f"{DETAIL_COLOR}    - {desc}{RESET_COLOR}")
-                            logger.debug(f"{dim}评分: {score_float:.2f}")
+                            color = score_color_for(score_float)
+                            lines.append(f"{color}  • {t(dim)}: {score_float:.2f} {get_progress_bar(score_float)}{RESET_COLOR}")
+                            lines.append(desc_line)
+                            logger.debug("%s评分: %.2f", dim, score_float)
                         except ValueError:
                             logger.warning(f"{dim}评分无效: {score}")
-                            print(f"{ERROR_COLOR}  • {t(dim)}: {t('数据无效')}{RESET_COLOR}")
+                            lines.append(f"{ERROR_COLOR}  • {t(dim)}: {t('数据无效')}{RESET_COLOR}")
             except Exception as e:
                 logger.error(f"处理主要评分指标时出错: {str(e)}")
-                print(f"{ERROR_COLOR}  • 评分数据处理错误{RESET_COLOR}")
+                lines.append(f"{ERROR_COLOR}  • 评分数据处理错误{RESET_COLOR}")
+            _write_lines(lines)
         
         # 4. 处理细分评分
         logger.debug("开始处理细分评分指标")
         sub_scores = deepseek_data.get("细分点评分", {})
         if sub_scores and isinstance(sub_scores, dict):
-            print(f"\n{SECTION_COLOR}3. 细分评分指标:{RESET_COLOR}")
+            lines = [f"\n{SECTION_COLOR}3. 细分评分指标:{RESET_COLOR}"]
             
             # 按类别组织细分评分
-            categories = {
-                "内容真实性": [],
-                "信息准确性": [],
-                "来源可靠性": [],
-                "引用质量": [],
-                "语言客观性": [],
-                "逻辑连贯性": []
-            }
+            categories = {category: [] for category in _MAIN_DIMENSIONS}
             
             for key, value in sub_scores.items():
-                for category in categories:
-                    if key.startswith(f"{category}_"):
-                        try:
-                            score = validate_score(value, f"细分评分.{key}")
-                            categories[category].append((key.split("_")[-1], score))
-                            logger.debug(f"细分评分 {key}: {score:.2f}")
-                        except ValueError:
-                            logger.warning(f"细分评分{key}无效: {value}")
+                category, sep, _ = key.partition("_")
+                if sep and category in categories:
+                    try:
+                        score = validate_score(value, f"细分评分.{key}")
+                        categories[category].append((key.rpartition("_")[2], score))
+                        logger.debug("细分评分 %s: %.2f", key, score)
+                    except ValueError:
+                        logger.warning(f"细分评分{key}无效: {value}")
             
             # 显示细分评分
             for category, scores in categories.items():
                 if scores:
-                    print(f"{SUBHEADER_COLOR}  ▶ {t(category+'相关指标')}:{RESET_COLOR}")
+                    lines.append(f"{SUBHEADER_COLOR}  ▶ {t(category+'相关指标')}:{RESET_COLOR}")
                     for name, score in scores:
-                        color = SUCCESS_COLOR if score >= 0.8 else (WARNING_COLOR if score >= 0.6 else ERROR_COLOR)
-                        print(f"{color}    • {t(name)}: {score:.2f} {get_progress_bar(score)}{RESET_COLOR}")
+                        color = score_color_for(score)
+                        lines.append(f"{color}    • {t(name)}: {score:.2f} {get_progress_bar(score)}{RESET_COLOR}")
+            _write_lines(lines)
         
         # 二、来源可靠性与引用分析
         print(f"\n{SUBHEADER_COLOR}{('二、' if language == 'zh' else '2. ')}{t('来源可靠性与引用分析')}{RESET_COLOR}")
-        print(f"{DETAIL_COLOR}{'━' * 70}{RESET_COLOR}")
+        print(f"{DETAIL_COLOR}{_RULE_THIN}{RESET_COLOR}")
         
         # 5. 处理引用分析
         logger.debug("开始处理引用分析")
@@ -1504,9 +1767,9 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                 logger.info(f"引用统计: 总数={total_citations}, 已验证={verified_citations}, 验证率={verification_rate:.1%}")
                 
                 # 根据验证率选择颜色
-                verification_color = SUCCESS_COLOR if verification_rate >= 0.8 else (WARNING_COLOR if verification_rate >= 0.5 else ERROR_COLOR)
-                authority_color = SUCCESS_COLOR if authority_score >= 0.8 else (WARNING_COLOR if authority_score >= 0.6 else ERROR_COLOR)
-                diversity_color = SUCCESS_COLOR if diversity_score >= 0.8 else (WARNING_COLOR if diversity_score >= 0.6 else ERROR_COLOR)
+                verification_color = score_color_for(verification_rate, 0.8, 0.5)
+                authority_color = score_color_for(authority_score)
+                diversity_color = score_color_for(diversity_score)
                 
                 print(f"{DETAIL_COLOR}  • 引用总数: {total_citations} 处{RESET_COLOR}")
                 print(f"{verification_color}  • 验证通过数: {verified_citations} 处 (验证率: {verification_rate:.1%}){RESET_COLOR}")
@@ -1515,19 +1778,25 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                 
                 # 引用详情
                 if "citation_details" in citation_data:
-                    print(f"\n{SECTION_COLOR}引用详情:{RESET_COLOR}")
-                    for i, cite in enumerate(citation_data["citation_details"], 1):
-                        logger.debug(f"处理第{i}个引用: {cite}")
-                        verified = cite.get('verified', False)
-                        status_color = SUCCESS_COLOR if verified else WARNING_COLOR
-                        print(f"{DETAIL_COLOR}  • 引用{i}:{RESET_COLOR}")
-                        print(f"{DETAIL_COLOR}    - 内容: {cite.get('quote', '未知')[:100]}...{RESET_COLOR}")
-                        print(f"{DETAIL_COLOR}    - 来源: {cite.get('source', '未知')}{RESET_COLOR}")
-                        print(f"{status_color}    - 验证状态: {'✓ 已验证' if verified else '✗ 未验证'}{RESET_COLOR}")
-                        if "verification_method" in cite:
-                            print(f"{DETAIL_COLOR}    - 验证方法: {cite['verification_method']}{RESET_COLOR}")
-                        if "confidence" in cite:
-                            print(f"{DETAIL_COLOR}    - 置信度: {cite['confidence']:.2%}{RESET_COLOR}")
+                    lines = [f"\n{SECTION_COLOR}引用详情:{RESET_COLOR}"]
+                    try:
+                        # 循环内使用局部别名，减少属性查找
+                        add_line = lines.append
+                        for i, cite in enumerate(citation_data["citation_details"], 1):
+                            if debug_enabled:
+                                logger.debug(f"处理第{i}个引用: {cite}")
+                            verified = cite.get('verified', False)
+                            status_color = SUCCESS_COLOR if verified else WARNING_COLOR
+                            add_line(f"{DETAIL_COLOR}  • 引用{i}:{RESET_COLOR}")
+                            add_line(f"{DETAIL_COLOR}    - 内容: {cite.get('quote', '未知')[:100]}...{RESET_COLOR}")
+                            add_line(f"{DETAIL_COLOR}    - 来源: {cite.get('source', '未知')}{RESET_COLOR}")
+                            add_line(f"{status_color}    - 验证状态: {'✓ 已验证' if verified else '✗ 未验证'}{RESET_COLOR}")
+                            if "verification_method" in cite:
+                                add_line(f"{DETAIL_COLOR}    - 验证方法: {cite['verification_method']}{RESET_COLOR}")
+                            if "confidence" in cite:
+                                add_line(f"{DETAIL_COLOR}    - 置信度: {cite['confidence']:.2%}{RESET_COLOR}")
+                    finally:
+                        _write_lines(lines)
             except Exception as e:
                 logger.error(f"处理引用分析时出错: {str(e)}")
                 print(f"{ERROR_COLOR}  • 引用数据处理错误{RESET_COLOR}")
@@ -1551,10 +1820,10 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                 estimated_reliable_sources = int(estimated_citations * reliable_source_ratio)
                 
                 # 展示推断的统计数据
-                verification_color = SUCCESS_COLOR if verified_ratio >= 0.8 else (WARNING_COLOR if verified_ratio >= 0.5 else ERROR_COLOR)
-                authority_color = SUCCESS_COLOR if source_reliability >= 0.8 else (WARNING_COLOR if source_reliability >= 0.6 else ERROR_COLOR)
+                verification_color = score_color_for(verified_ratio, 0.8, 0.5)
+                authority_color = score_color_for(source_reliability)
                 diversity_score = (source_reliability * 0.7 + citation_quality * 0.3)  # 基于两个指标计算多样性
-                diversity_color = SUCCESS_COLOR if diversity_score >= 0.8 else (WARNING_COLOR if diversity_score >= 0.6 else ERROR_COLOR)
+                diversity_color = score_color_for(diversity_score)
                 
                 print(f"{DETAIL_COLOR}  • 估计引用总数: 约{estimated_citations}处{RESET_COLOR}")
                 print(f"{verification_color}  • 估计有效引用: 约{estimated_verified}处 (有效率: {verified_ratio:.1%}){RESET_COLOR}")
@@ -1574,7 +1843,7 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                 ]
                 
                 for name, score, desc in features:
-                    score_color = SUCCESS_COLOR if score >= 0.8 else (WARNING_COLOR if score >= 0.6 else ERROR_COLOR)
+                    score_color = score_color_for(score)
                     print(f"{score_color}  • {name}: {score:.2f} {get_progress_bar(score)}{RESET_COLOR}")
                     print(f"{DETAIL_COLOR}    - {desc}{RESET_COLOR}")
                 
@@ -1606,20 +1875,17 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         print(f"\n{SECTION_COLOR}2. 来源评分与分析:{RESET_COLOR}")
         
         # 尝试从不同位置提取来源数据
-        source_quality_data = None
-        for key in ["source_quality", "来源质量", "domain_credibility", "域名可信度"]:
-            if key in result and result[key]:
-                source_quality_data = result[key]
-                logger.info(f"找到来源质量数据，键名: {key}")
-                break
+        key, source_quality_data = _first_present(result, _SOURCE_KEYS)
+        if key:
+            logger.info(f"找到来源质量数据，键名: {key}")
         
         if main_scores and isinstance(main_scores, dict):
             try:
                 source_reliability = float(main_scores.get("来源可靠性", 0))
                 citation_quality = float(main_scores.get("引用质量", 0))
                 
-                source_color = SUCCESS_COLOR if source_reliability >= 0.8 else (WARNING_COLOR if source_reliability >= 0.6 else ERROR_COLOR)
-                citation_color = SUCCESS_COLOR if citation_quality >= 0.8 else (WARNING_COLOR if citation_quality >= 0.6 else ERROR_COLOR)
+                source_color = score_color_for(source_reliability)
+                citation_color = score_color_for(citation_quality)
                 
                 print(f"{source_color}  • {t('来源可靠性')}: {source_reliability:.2f} {get_progress_bar(source_reliability)}{RESET_COLOR}")
                 print(f"{citation_color}  • {t('引用质量')}: {citation_quality:.2f} {get_progress_bar(citation_quality)}{RESET_COLOR}")
@@ -1643,63 +1909,66 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         
         # 显示详细的来源质量数据
         if source_quality_data and isinstance(source_quality_data, dict):
-            print(f"\n{SECTION_COLOR}3. 详细来源分析:{RESET_COLOR}")
-            
-            # 域名信息
-            domain_trust = source_quality_data.get("domain_trust", source_quality_data.get("trust_level", "未知"))
-            if domain_trust != "未知":
-                trust_color = SUCCESS_COLOR if "高" in domain_trust else (WARNING_COLOR if "中" in domain_trust else ERROR_COLOR)
-                print(f"{trust_color}  • 域名可信度: {domain_trust}{RESET_COLOR}")
+            lines = [f"\n{SECTION_COLOR}3. 详细来源分析:{RESET_COLOR}"]
+            try:
+                # 域名信息
+                domain_trust = source_quality_data.get("domain_trust", source_quality_data.get("trust_level", "未知"))
+                if domain_trust != "未知":
+                    trust_color = score_colors[_trust_level_index(domain_trust)]
+                    lines.append(f"{trust_color}  • 域名可信度: {domain_trust}{RESET_COLOR}")
             
-            # 来源统计
-            source_count = source_quality_data.get("source_count", 0)
-            if source_count > 0:
-                count_color = SUCCESS_COLOR if source_count >= 5 else (WARNING_COLOR if source_count >= 2 else ERROR_COLOR)
-                print(f"{count_color}  • 引用来源数量: {source_count} 个{RESET_COLOR}")
+                # 来源统计
+                source_count = source_quality_data.get("source_count", 0)
+                if source_count > 0:
+                    count_color = score_color_for(source_count, 5, 2)
+                    lines.append(f"{count_color}  • 引用来源数量: {source_count} 个{RESET_COLOR}")
             
-            # 权威来源
-            authority_sources = source_quality_data.get("authority_sources", 0)
-            if authority_sources > 0:
-                auth_color = SUCCESS_COLOR if authority_sources >= 3 else (WARNING_COLOR if authority_sources >= 1 else ERROR_COLOR)
-                print(f"{auth_color}  • 权威来源数量: {authority_sources} 个{RESET_COLOR}")
+                # 权威来源
+                authority_sources = source_quality_data.get("authority_sources", 0)
+                if authority_sources > 0:
+                    auth_color = score_color_for(authority_sources, 3, 1)
+                    lines.append(f"{auth_color}  • 权威来源数量: {authority_sources} 个{RESET_COLOR}")
             
-            # 直接引用
-            direct_quotes = source_quality_data.get("direct_quotes", 0)
-            if direct_quotes > 0:
-                quote_color = SUCCESS_COLOR if direct_quotes >= 3 else (WARNING_COLOR if direct_quotes >= 1 else ERROR_COLOR)
-                print(f"{quote_color}  • 直接引用数量: {direct_quotes} 个{RESET_COLOR}")
+                # 直接引用
+                direct_quotes = source_quality_data.get("direct_quotes", 0)
+                if direct_quotes > 0:
+                    quote_color = score_color_for(direct_quotes, 3, 1)
+                    lines.append(f"{quote_color}  • 直接引用数量: {direct_quotes} 个{RESET_COLOR}")
             
-            # 来源列表
-            source_list = source_quality_data.get("sources", source_quality_data.get("source_list", []))
-            if source_list and isinstance(source_list, list) and len(source_list) > 0:
-                print(f"\n{DETAIL_COLOR}  • 主要来源列表:{RESET_COLOR}")
-                for i, source in enumerate(source_list[:5], 1):  # 最多显示5个来源
-                    if isinstance(source, dict):
-                        name = source.get("name", "未知来源")
-                        reliability = source.get("reliability", 0)
-                        rel_color = SUCCESS_COLOR if reliability >= 0.8 else (WARNING_COLOR if reliability >= 0.6 else ERROR_COLOR)
-                        print(f"{DETAIL_COLOR}    {i}. {name}{RESET_COLOR}")
-                        if reliability > 0:
-                            print(f"{rel_color}       可信度: {reliability:.2f} {get_progress_bar(reliability)}{RESET_COLOR}")
-                    else:
-                        print(f"{DETAIL_COLOR}    {i}. {source}{RESET_COLOR}")
+                # 来源列表
+                source_list = source_quality_data.get("sources", source_quality_data.get("source_list", []))
+                if source_list and isinstance(source_list, list) and len(source_list) > 0:
+                    lines.append(f"\n{DETAIL_COLOR}  • 主要来源列表:{RESET_COLOR}")
+                    add_line, progress_bar = lines.append, get_progress_bar
+                    for i, source in enumerate(source_list[:5], 1):  # 最多显示5个来源
+                        if isinstance(source, dict):
+                            name = source.get("name", "未知来源")
+                            reliability = source.get("reliability", 0)
+                            rel_color = score_color_for(reliability)
+                            add_line(f"{DETAIL_COLOR}    {i}. {name}{RESET_COLOR}")
+                            if reliability > 0:
+                                add_line(f"{rel_color}       可信度: {reliability:.2f} {progress_bar(reliability)}{RESET_COLOR}")
+                        else:
+                            add_line(f"{DETAIL_COLOR}    {i}. {source}{RESET_COLOR}")
                 
-                if len(source_list) > 5:
-                    print(f"{DETAIL_COLOR}    ... 等共 {len(source_list)} 个来源{RESET_COLOR}")
+                    if len(source_list) > 5:
+                        lines.append(f"{DETAIL_COLOR}    ... 等共 {len(source_list)} 个来源{RESET_COLOR}")
             
-            # 域名信息
-            if "domain_info" in source_quality_data:
-                domain_info = source_quality_data["domain_info"]
-                if isinstance(domain_info, dict) and domain_info:
-                    print(f"\n{DETAIL_COLOR}  • 域名信息:{RESET_COLOR}")
-                    if "registration_date" in domain_info:
-                        print(f"{DETAIL_COLOR}    - 注册日期: {domain_info['registration_date']}{RESET_COLOR}")
-                    if "reputation" in domain_info:
-                        rep = domain_info["reputation"]
-                        rep_color = SUCCESS_COLOR if rep >= 8 else (WARNING_COLOR if rep >= 5 else ERROR_COLOR)
-                        print(f"{rep_color}    - 网站声誉评分: {rep}/10{RESET_COLOR}")
-                    if "category" in domain_info:
-                        print(f"{DETAIL_COLOR}    - 网站类别: {domain_info['category']}{RESET_COLOR}")
+                # 域名信息
+                if "domain_info" in source_quality_data:
+                    domain_info = source_quality_data["domain_info"]
+                    if isinstance(domain_info, dict) and domain_info:
+                        lines.append(f"\n{DETAIL_COLOR}  • 域名信息:{RESET_COLOR}")
+                        if "registration_date" in domain_info:
+                            lines.append(f"{DETAIL_COLOR}    - 注册日期: {domain_info['registration_date']}{RESET_COLOR}")
+                        if "reputation" in domain_info:
+                            rep = domain_info["reputation"]
+                            rep_color = score_color_for(rep, 8, 5)
+                            lines.append(f"{rep_color}    - 网站声誉评分: {rep}/10{RESET_COLOR}")
+                        if "category" in domain_info:
+                            lines.append(f"{DETAIL_COLOR}    - 网站类别: {domain_info['category']}{RESET_COLOR}")
+            finally:
+                _write_lines(lines)
         
         # 如果没有任何来源数据
         if not source_quality_data and not (main_scores and isinstance(main_scores, dict) and ("来源可靠性" in main_scores or "引用质量" in main_scores)):
@@ -1708,7 +1977,7 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         
         # 三、语言分析
         print(f"\n{SUBHEADER_COLOR}{('三、' if language == 'zh' else '3. ')}{t('语言与逻辑分析')}{RESET_COLOR}")
-        print(f"{DETAIL_COLOR}{'━' * 70}{RESET_COLOR}")
+        print(f"{DETAIL_COLOR}{_RULE_THIN}{RESET_COLOR}")
         
         # 7. 处理语言中立性
         logger.debug("开始处理语言中立性分析")
@@ -1720,7 +1989,7 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
             if "score" in neutrality:
                 try:
                     overall_score = validate_score(neutrality["score"], "语言中立性总分")
-                    score_color = SUCCESS_COLOR if overall_score >= 0.8 else (WARNING_COLOR if overall_score >= 0.6 else ERROR_COLOR)
+                    score_color = score_color_for(overall_score)
                     print(f"{score_color}  • 总体评分: {overall_score:.2f} {get_progress_bar(overall_score)}{RESET_COLOR}")
                     logger.info(f"语言中立性总分: {overall_score:.2f}")
                 except ValueError:
@@ -1729,28 +1998,24 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
             # DeepSeek详细评分
             scores = neutrality.get("deepseek_scores", {})
             if scores and isinstance(scores, dict):
-                print(f"\n{SECTION_COLOR}2. 详细评分指标:{RESET_COLOR}")
+                lines = [f"\n{SECTION_COLOR}2. 详细评分指标:{RESET_COLOR}"]
                 try:
-                    score_descriptions = {
-                        "情感词汇": "文本中情感色彩词汇的使用程度",
-                        "情感平衡": "正面与负面情感的平衡程度",
-                        "极端表述": "极端或绝对化表述的使用程度",
-                        "煽动性表达": "可能引起强烈情感反应的表达",
-                        "主观评价": "个人观点和主观判断的程度"
-                    }
+                    # 该部分说明只显示中文
+                    description_lines = _description_lines(_NEUTRALITY_DESCRIPTIONS, 'zh', DETAIL_COLOR, RESET_COLOR)
                     
                     for key, value in scores.items():
                         try:
                             score = validate_score(value, f"语言中立性.{key}")
-                            score_color = SUCCESS_COLOR if score >= 0.8 else (WARNING_COLOR if score >= 0.6 else ERROR_COLOR)
-                            print(f"{score_color}  • {key}: {score:.2f} {get_progress_bar(score)}{RESET_COLOR}")
-                            if key in score_descriptions:
-                                print(f"{DETAIL_COLOR}    - {score_descriptions[key]}{RESET_COLOR}")
-                            logger.debug(f"语言中立性 {key}: {score:.2f}")
+                            score_color = score_color_for(score)
+                            lines.append(f"{score_color}  • {key}: {score:.2f} {get_progress_bar(score)}{RESET_COLOR}")
+                            if key in description_lines:
+                                lines.append(description_lines[key])
+                            logger.debug("语言中立性 %s: %.2f", key, score)
                         except ValueError:
                             logger.warning(f"语言中立性评分{key}无效: {value}")
                 except Exception as e:
                     logger.error(f"处理语言中立性详细评分时出错: {str(e)}")
+                _write_lines(lines)
             
             # DeepSeek分析结果
             if "deepseek_analysis" in neutrality:
@@ -1767,21 +2032,16 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         if main_scores and isinstance(main_scores, dict):
             print(f"\n{SECTION_COLOR}语言表达评分:{RESET_COLOR}")
             try:
-                language_scores = {
-                    "语言客观性": "语言表达的客观中立程度",
-                    "逻辑连贯性": "内容的逻辑性和连贯性",
-                    "表达准确性": "用词和表达的准确程度",
-                    "专业性": "专业术语和概念的使用准确性"
-                }
-                
-                for key, desc in language_scores.items():
+                # 该部分说明只显示中文
+                language_lines = _description_lines(_LANGUAGE_SCORE_DESCRIPTIONS, 'zh', DETAIL_COLOR, RESET_COLOR)
+                for key, desc_line in language_lines.items():
                     if key in main_scores:
                         try:
                             score = validate_score(main_scores[key], f"语言评分.{key}")
-                            score_color = SUCCESS_COLOR if score >= 0.8 else (WARNING_COLOR if score >= 0.6 else ERROR_COLOR)
+                            score_color = score_color_for(score)
                             print(f"{score_color}  • {key}: {score:.2f} {get_progress_bar(score)}{RESET_COLOR}")
-                            print(f"{DETAIL_COLOR}    - {desc}{RESET_COLOR}")
-                            logger.debug(f"语言评分 {key}: {score:.2f}")
+                            print(desc_line)
+                            logger.debug("语言评分 %s: %.2f", key, score)
                         except ValueError:
                             logger.warning(f"语言评分{key}无效: {main_scores[key]}")
             except Exception as e:
@@ -1789,7 +2049,7 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         
         # 添加交叉验证部分
         print(f"\n{SUBHEADER_COLOR}{('四、' if language == 'zh' else '4. ')}{t('交叉验证结果')}{RESET_COLOR}")
-        print(f"{DETAIL_COLOR}{'━' * 70}{RESET_COLOR}")
+        print(f"{DETAIL_COLOR}{_RULE_THIN}{RESET_COLOR}")
         
         # 优化交叉验证数据的显示
         has_cv_data = False
@@ -1797,149 +2057,145 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         # 检查是否有标准格式的交叉验证数据
         if cross_validation_data and isinstance(cross_validation_data, dict):
             has_cv_data = True
-            print(f"{SECTION_COLOR}{t('交叉验证评估')}:{RESET_COLOR}")
+            lines = [f"{SECTION_COLOR}{t('交叉验证评估')}:{RESET_COLOR}"]
+            emit = lines.append
+            # 交叉验证部分统一使用0.7/0.5阈值
+            cv_color_for = partial(score_color_for, hi=0.7, mid=0.5)
             try:
                 # 提取验证点
-                verification_points = []
                 # 尝试多个可能的键名
-                for key in ["verification_points", "claims", "验证点", "关键声明", "points"]:
-                    if key in cross_validation_data and cross_validation_data[key]:
-                        verification_points = cross_validation_data[key]
-                        logger.info(f"找到验证点数据，键名: {key}")
-                        break
+                key, verification_points = _first_present(cross_validation_data, _VPOINT_KEYS)
+                if key:
+                    logger.info(f"找到验证点数据，键名: {key}")
+                else:
+                    verification_points = []
                 
                 # 提取来源信息
-                sources = []
-                for key in ["sources", "verified_sources", "相关来源", "related_sources"]:
-                    if key in cross_validation_data and cross_validation_data[key]:
-                        sources = cross_validation_data[key]
-                        logger.info(f"找到来源数据，键名: {key}")
-                        break
+                key, sources = _first_present(cross_validation_data, _CV_SOURCE_KEYS)
+                if key:
+                    logger.info(f"找到来源数据，键名: {key}")
+                else:
+                    sources = []
                 
                 # 显示验证点
                 if verification_points:
-                    print(f"\n{SECTION_COLOR}{t('验证点分析')}:{RESET_COLOR}")
+                    emit(f"\n{SECTION_COLOR}{t('验证点分析')}:{RESET_COLOR}")
+                    progress_bar = get_progress_bar
                     for i, point in enumerate(verification_points, 1):
-                        if isinstance(point, dict):
-                            # --> NEW: Check for the 'key_points' structure <--
-                            if "key_points" in point and isinstance(point["key_points"], list):
-                                print(f"{DETAIL_COLOR}  • {t('验证点')} {i}:{RESET_COLOR}")
-                                for j, sub_point in enumerate(point["key_points"], 1):
-                                    if isinstance(sub_point, dict) and "内容" in sub_point:
-                                        content = sub_point["内容"]
-                                        importance = sub_point.get("重要性", "中")
-                                        importance_translated = t(importance)
-                                        # Try to get the overall score for the main point
-                                        main_point_score = None
-                                        for score_key in ["验证评分", "score", "评分"]:
-                                            if score_key in point and point[score_key] is not None:
-                                                try:
-                                                    main_point_score = float(point[score_key])
-                                                    break
-                                                except (ValueError, TypeError):
-                                                    pass
-                                        score_color = SUCCESS_COLOR if main_point_score is not None and main_point_score >= 0.7 else (WARNING_COLOR if main_point_score is not None and main_point_score >= 0.5 else ERROR_COLOR)
-
-                                        print(f"{score_color}    {j}. {content}{RESET_COLOR}")
-                                        print(f"{DETAIL_COLOR}       {t('重要性')}: {importance_translated}{RESET_COLOR}")
-
-                                # After processing sub-points, print the overall score for the main point
-                                if main_point_score is not None:
-                                     print(f"{score_color}    {t('总体得分')}: {main_point_score:.2f}{RESET_COLOR}")
-
-                            # --> EXISTING LOGIC for points without 'key_points' <--
-                            else:
-                                # 获取内容，尝试多个可能的键名
-                                content = None
-                                for content_key in ["内容", "验证内容", "content", "claim", "statement"]:
-                                    if content_key in point and point[content_key]:
-                                        content = point[content_key]
-                                        break
-                                if not content: content = t("未知内容")
-
-                                # 获取分数，尝试多个可能的键名
-                                score = None
-                                for score_key in ["验证评分", "评分", "score", "confidence"]:
-                                    if score_key in point and point[score_key] is not None:
-                                        try:
-                                            score = float(point[score_key])
-                                            break
-                                        except (ValueError, TypeError): pass
-                                if score is None: score = 0.5
-
-                                score_color = SUCCESS_COLOR if score >= 0.7 else (WARNING_COLOR if score >= 0.5 else ERROR_COLOR)
-                                print(f"{score_color}  • {t('验证点')} {i}: {content}{RESET_COLOR}")
-                                print(f"{score_color}    {t('得分')}: {score:.2f} {get_progress_bar(score)}{RESET_COLOR}")
-
-                                # 如果有验证结论，显示它
-                                if "验证结论" in point and point["验证结论"]:
-                                    print(f"{DETAIL_COLOR}    {t('结论')}: {point['验证结论']}{RESET_COLOR}")
-
-                                # 如果有搜索结果数量，显示它
-                                if "搜索结果数量" in point:
-                                    result_count = point["搜索结果数量"]
-                                    if result_count == 0:
-                                        print(f"{WARNING_COLOR}    {t('搜索结果')}: {t('未找到相关内容')}{RESET_COLOR}")
-                                    else:
-                                        print(f"{DETAIL_COLOR}    {t('搜索结果')}: {result_count}{t('个')}{t('相关内容')}{RESET_COLOR}")
-
-                                # 显示搜索结果链接和摘要
-                                if "搜索结果摘要" in point and point["搜索结果摘要"]:
-                                    print(f"{DETAIL_COLOR}    {t('相关信息摘要')}:{RESET_COLOR}")
-                                    for j, summary in enumerate(point["搜索结果摘要"], 1):
-                                        if summary:
-                                            if len(summary) > 100:
-                                                formatted_summary = summary[:40] + "..." + summary[len(summary)-40:]
-                                            else:
-                                                formatted_summary = summary
-                                            print(f"{DETAIL_COLOR}      {j}. {formatted_summary}{RESET_COLOR}")
-
-                                # 获取搜索结果链接
-                                search_results = None
-                                for results_key in ["search_results", "搜索结果", "results", "相关信息"]:
-                                    if results_key in point and point[results_key]:
-                                        search_results = point[results_key]
+                        if not isinstance(point, dict):
+                            emit(f"{WARNING_COLOR}  • {t('验证点')} {i}: {t('格式无效')}{RESET_COLOR}")
+                            continue
+
+                        get = point.get
+                        key_points = get("key_points")
+                        # --> NEW: Check for the 'key_points' structure <--
+                        if isinstance(key_points, list):
+                            emit(f"{DETAIL_COLOR}  • {t('验证点')} {i}:{RESET_COLOR}")
+                            # Get the overall score for the main point once, before its sub-points
+                            main_point_score = None
+                            for score_key in ("验证评分", "score", "评分"):
+                                score_value = get(score_key)
+                                if score_value is not None:
+                                    try:
+                                        main_point_score = float(score_value)
                                         break
+                                    except (ValueError, TypeError):
+                                        pass
+                            score_color = cv_color_for(main_point_score) if main_point_score is not None else ERROR_COLOR
+
+                            for j, sub_point in enumerate(key_points, 1):
+                                if isinstance(sub_point, dict) and "内容" in sub_point:
+                                    content = sub_point["内容"]
+                                    importance = sub_point.get("重要性", "中")
+                                    importance_translated = t(importance)
+                                    emit(f"{score_color}    {j}. {content}{RESET_COLOR}")
+                                    emit(f"{DETAIL_COLOR}       {t('重要性')}: {importance_translated}{RESET_COLOR}")
 
-                                # 如果找到了搜索结果链接，显示它们
-                                if search_results and isinstance(search_results, list):
-                                    print(f"{DETAIL_COLOR}    {t('相关链接')}:{RESET_COLOR}")
-                                    for j, result_item in enumerate(search_results[:3], 1):  # 限制显示3个链接
-                                        if isinstance(result_item, dict):
-                                            url = result_item.get("url", "")
-                                            title = result_item.get("title", t("未知标题"))
-                                            print(f"{DETAIL_COLOR}      {j}. {title}{RESET_COLOR}")
-                                            print(f"{INFO_COLOR}         {url}{RESET_COLOR}")
-
-                                            content = result_item.get("content", "")
-                                            if content:
-                                                if len(content) > 100:
-                                                    formatted_content = content[:40] + "..." + content[len(content)-40:]
-                                                else:
-                                                    formatted_content = content
-                                                print(f"{NEUTRAL_COLOR}         {t('摘要')}: {formatted_content}{RESET_COLOR}")
-                                        elif isinstance(result_item, str) and ("http://" in result_item or "https://" in result_item):
-                                            print(f"{INFO_COLOR}      {j}. {result_item}{RESET_COLOR}")
-
-                                    if len(search_results) > 3:
-                                        print(f"{DETAIL_COLOR}      ... {t('等共')} {len(search_results)} {t('个')}{t('相关链接')}{RESET_COLOR}")
+                            # After processing sub-points, print the overall score for the main point
+                            if main_point_score is not None:
+                                 emit(f"{score_color}    {t('总体得分')}: {main_point_score:.2f}{RESET_COLOR}")
+
+                        # --> EXISTING LOGIC for points without 'key_points' <--
                         else:
-                            print(f"{WARNING_COLOR}  • {t('验证点')} {i}: {t('格式无效')}{RESET_COLOR}")
+                            # 获取内容，尝试多个可能的键名
+                            _, content = _first_present(point, _POINT_CONTENT_KEYS)
+                            if not content: content = t("未知内容")
+
+                            # 获取分数，尝试多个可能的键名
+                            score = None
+                            for score_key in _POINT_SCORE_KEYS:
+                                score_value = get(score_key)
+                                if score_value is not None:
+                                    try:
+                                        score = float(score_value)
+                                        break
+                                    except (ValueError, TypeError): pass
+                            if score is None: score = 0.5
+
+                            score_color = cv_color_for(score)
+                            emit(f"{score_color}  • {t('验证点')} {i}: {content}{RESET_COLOR}")
+                            emit(f"{score_color}    {t('得分')}: {score:.2f} {progress_bar(score)}{RESET_COLOR}")
+
+                            # 如果有验证结论，显示它
+                            point_conclusion = get("验证结论")
+                            if point_conclusion:
+                                emit(f"{DETAIL_COLOR}    {t('结论')}: {point_conclusion}{RESET_COLOR}")
+
+                            # 如果有搜索结果数量，显示它
+                            if "搜索结果数量" in point:
+                                result_count = point["搜索结果数量"]
+                                if result_count == 0:
+                                    emit(f"{WARNING_COLOR}    {t('搜索结果')}: {t('未找到相关内容')}{RESET_COLOR}")
+                                else:
+                                    emit(f"{DETAIL_COLOR}    {t('搜索结果')}: {result_count}{t('个')}{t('相关内容')}{RESET_COLOR}")
+
+                            # 显示搜索结果链接和摘要
+                            summaries = get("搜索结果摘要")
+                            if summaries:
+                                emit(f"{DETAIL_COLOR}    {t('相关信息摘要')}:{RESET_COLOR}")
+                                for j, summary in enumerate(summaries, 1):
+                                    if summary:
+                                        emit(f"{DETAIL_COLOR}      {j}. {_ellipsize(summary)}{RESET_COLOR}")
+
+                            # 获取搜索结果链接
+                            _, search_results = _first_present(point, _POINT_RESULTS_KEYS)
+
+                            # 如果找到了搜索结果链接，显示它们
+                            if search_results and isinstance(search_results, list):
+                                emit(f"{DETAIL_COLOR}    {t('相关链接')}:{RESET_COLOR}")
+                                result_total = len(search_results)
+                                for j, result_item in enumerate(islice(search_results, 3), 1):  # 限制显示3个链接
+                                    if isinstance(result_item, dict):
+                                        url = result_item.get("url", "")
+                                        title = result_item.get("title", t("未知标题"))
+                                        link_text = (f"{DETAIL_COLOR}      {j}. {title}{RESET_COLOR}\n"
+                                                     f"{INFO_COLOR}         {url}{RESET_COLOR}")
+
+                                        content = result_item.get("content", "")
+                                        if content:
+                                            link_text += f"\n{NEUTRAL_COLOR}         {t('摘要')}: {_ellipsize(content)}{RESET_COLOR}"
+                                        emit(link_text)
+                                    elif isinstance(result_item, str) and result_item.startswith(_LINK_PREFIXES):
+                                        emit(f"{INFO_COLOR}      {j}. {result_item}{RESET_COLOR}")
+
+                                if result_total > 3:
+                                    emit(f"{DETAIL_COLOR}      ... {t('等共')} {result_total} {t('个')}{t('相关链接')}{RESET_COLOR}")
                 else:
                     # 如果没有验证点但已通过测试验证了SearXNG可用，显示提示信息
-                    print(f"\n{WARNING_COLOR}  • 未能成功提取验证点，但搜索服务正常{RESET_COLOR}")
-                    print(f"{DETAIL_COLOR}  • 建议: 请检查文本是否包含可验证的事实陈述{RESET_COLOR}")
+                    emit(f"\n{WARNING_COLOR}  • 未能成功提取验证点，但搜索服务正常{RESET_COLOR}")
+                    emit(f"{DETAIL_COLOR}  • 建议: 请检查文本是否包含可验证的事实陈述{RESET_COLOR}")
                 
                 # 显示来源信息
                 if sources:
-                    print(f"\n{SECTION_COLOR}相关来源分析:{RESET_COLOR}")
+                    emit(f"\n{SECTION_COLOR}相关来源分析:{RESET_COLOR}")
                     for i, source in enumerate(sources, 1):
-                        if isinstance(source, dict):
-                            url = source.get("url", "未知URL")
-                            reliability = source.get("reliability", source.get("credibility", 0.5))
-                            rel_color = SUCCESS_COLOR if reliability >= 0.7 else (WARNING_COLOR if reliability >= 0.5 else ERROR_COLOR)
-                            print(f"{rel_color}  • 来源 {i}: {url}{RESET_COLOR}")
-                            print(f"{rel_color}    可信度: {reliability:.2f} {get_progress_bar(reliability)}{RESET_COLOR}")
+                        if not isinstance(source, dict):
+                            continue
+                        url = source.get("url", "未知URL")
+                        reliability = _lookup(source, _SOURCE_RELIABILITY_KEYS, 0.5)
+                        rel_color = cv_color_for(reliability)
+                        emit(f"{rel_color}  • 来源 {i}: {url}{RESET_COLOR}")
+                        emit(f"{rel_color}    可信度: {reliability:.2f} {get_progress_bar(reliability)}{RESET_COLOR}")
                 
                 # 显示整体评分
                 # 优先使用dimension_scores中的交叉验证分数，这是实际参与总分计算的值
@@ -1954,26 +2210,27 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                         logger.info(f"使用cross_validation_data['score']的交叉验证分数: {cv_score}")
                     else:
                         # 如果找不到score字段，再尝试其他字段
-                        cv_score = cross_validation_data.get("overall_score", cross_validation_data.get("总体可信度", 0.5))
+                        cv_score = _lookup(cross_validation_data, _CV_SCORE_FALLBACK_KEYS, 0.5)
                         logger.warning(f"未找到交叉验证score字段，使用备选字段值: {cv_score}")
                 
-                score_color = SUCCESS_COLOR if cv_score >= 0.7 else (WARNING_COLOR if cv_score >= 0.5 else ERROR_COLOR)
-                print(f"\n{score_color}  • 交叉验证总分: {cv_score:.2f} {get_progress_bar(cv_score)}{RESET_COLOR}")
+                score_color = cv_color_for(cv_score)
+                emit(f"\n{score_color}  • 交叉验证总分: {cv_score:.2f} {get_progress_bar(cv_score)}{RESET_COLOR}")
                 
                 # 显示验证结论
-                if "验证结论" in cross_validation_data and cross_validation_data["验证结论"]:
-                    print(f"{DETAIL_COLOR}  • 验证结论: {cross_validation_data['验证结论']}{RESET_COLOR}")
+                conclusion = cross_validation_data.get("验证结论")
+                if conclusion:
+                    emit(f"{DETAIL_COLOR}  • 验证结论: {conclusion}{RESET_COLOR}")
                 
                 # 显示时效性
-                timeliness = cross_validation_data.get("timeliness", cross_validation_data.get("时效性", "未知"))
-                print(f"{DETAIL_COLOR}  • 时效性评估: {timeliness}{RESET_COLOR}")
+                timeliness = _lookup(cross_validation_data, _CV_TIMELINESS_KEYS, "未知")
+                emit(f"{DETAIL_COLOR}  • 时效性评估: {timeliness}{RESET_COLOR}")
                 
                 # 显示可信内容总结 (新增部分)
-                if "可信内容总结" in cross_validation_data and cross_validation_data["可信内容总结"]:
-                    print(f"\n{SECTION_COLOR}可信内容总结:{RESET_COLOR}")
-                    summary = cross_validation_data["可信内容总结"]
+                summary = cross_validation_data.get("可信内容总结")
+                if summary:
+                    emit(f"\n{SECTION_COLOR}可信内容总结:{RESET_COLOR}")
                     # 使用醒目颜色显示总结
-                    print(f"{SUCCESS_COLOR}  {summary}{RESET_COLOR}")
+                    emit(f"{SUCCESS_COLOR}  {summary}{RESET_COLOR}")
                 
                 # 显示问题点 - 修改此部分
                 # 计算验证点中无结果的数量和来源数量
@@ -1981,16 +2238,9 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                 source_count = 0
                 search_results_count = 0
                 
-                # 首先尝试计算无结果的验证点
+                # 首先一次遍历计算无结果的验证点和搜索结果总数
                 if verification_points and isinstance(verification_points, list):
-                    no_result_count = sum(1 for p in verification_points if isinstance(p, dict) and p.get("搜索结果数量", 0) == 0)
-                    
-                    # 同时尝试从验证点中获取搜索结果总数
-                    for p in verification_points:
-                        if isinstance(p, dict) and "搜索结果" in p and isinstance(p["搜索结果"], int):
-                            search_results_count += p["搜索结果"]
-                        elif isinstance(p, dict) and "搜索结果数量" in p and isinstance(p["搜索结果数量"], int):
-                            search_results_count += p["搜索结果数量"]
+                    no_result_count, search_results_count = _count_search_results(verification_points)
                 
                 # 尝试获取来源数量
                 # 直接使用来源列表长度
@@ -1999,10 +2249,11 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                 # 尝试从交叉验证数据中获取来源数量
                 else:
                     # 尝试多种可能的键名
-                    for key in ["source_count", "sources_count", "搜索结果总数", "来源数量", "相关来源数"]:
-                        if key in cross_validation_data and isinstance(cross_validation_data[key], (int, float, str)):
+                    for key in _CV_SOURCE_COUNT_KEYS:
+                        value = cross_validation_data.get(key)
+                        if isinstance(value, (int, float, str)):
                             try:
-                                source_count = int(cross_validation_data[key])
+                                source_count = int(value)
                                 break
                             except (ValueError, TypeError):
                                 pass
@@ -2013,29 +2264,29 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                     source_count = search_results_count
                 
                 # 只有在确实有验证点但没有找到结果，或来源太少时才显示问题
-                has_problems = False
-                
                 if verification_points:
+                    # 先收集问题行，有问题时统一输出一次标题
+                    problem_lines = []
+                    
                     # 只有当来源确实太少(小于2)且搜索结果也不足时才显示来源不足问题
                     if source_count < 2 and search_results_count < 3:
-                        has_problems = True
-                        print(f"\n{SECTION_COLOR}交叉验证问题:{RESET_COLOR}")
-                        print(f"{WARNING_COLOR}  • 缺乏足够的交叉验证来源 (仅{source_count}个){RESET_COLOR}")
-                        print(f"{DETAIL_COLOR}    - 建议：建议寻找更多独立来源验证信息{RESET_COLOR}")
+                        problem_lines.append(f"{WARNING_COLOR}  • 缺乏足够的交叉验证来源 (仅{source_count}个){RESET_COLOR}")
+                        problem_lines.append(f"{DETAIL_COLOR}    - 建议：建议寻找更多独立来源验证信息{RESET_COLOR}")
                     
                     # 无论来源数量如何，如果有验证点没有找到结果，都显示这个问题
                     if no_result_count > 0:
-                        if not has_problems:
-                            has_problems = True
-                            print(f"\n{SECTION_COLOR}交叉验证问题:{RESET_COLOR}")
-                            
-                        print(f"{WARNING_COLOR}  • {no_result_count}个验证点没有找到相关信息{RESET_COLOR}")
-                        print(f"{DETAIL_COLOR}    - 这些验证点可能需要额外验证{RESET_COLOR}")
-                        print(f"{DETAIL_COLOR}    - 建议：针对这些特定信息点进行额外验证{RESET_COLOR}")
+                        problem_lines.append(f"{WARNING_COLOR}  • {no_result_count}个验证点没有找到相关信息{RESET_COLOR}")
+                        problem_lines.append(f"{DETAIL_COLOR}    - 这些验证点可能需要额外验证{RESET_COLOR}")
+                        problem_lines.append(f"{DETAIL_COLOR}    - 建议：针对这些特定信息点进行额外验证{RESET_COLOR}")
+                    
+                    if problem_lines:
+                        emit(f"\n{SECTION_COLOR}交叉验证问题:{RESET_COLOR}")
+                        lines.extend(problem_lines)
                 
             except Exception as e:
                 logger.error(f"处理交叉验证数据时出错: {str(e)}")
-                print(f"{ERROR_COLOR}  • 交叉验证数据处理错误: {str(e)}{RESET_COLOR}")
+                emit(f"{ERROR_COLOR}  • 交叉验证数据处理错误: {str(e)}{RESET_COLOR}")
+            _write_lines(lines)
         
         # 检查权重中是否有交叉验证的贡献
         if not has_cv_data and "交叉验证" in weights:
@@ -2049,7 +2300,7 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         # 无交叉验证数据的情况
         if not has_cv_data:
             # 检查日志中是否记录了交叉验证信息
-            if "validation" in str(result).lower() or "交叉验证" in str(result):
+            if _mentions_cross_validation(result):
                 print(f"{WARNING_COLOR}  • 发现交叉验证相关信息，但格式无法解析{RESET_COLOR}")
                 print(f"{DETAIL_COLOR}  • 建议：查看日志获取更多交叉验证详情{RESET_COLOR}")
             else:
@@ -2063,17 +2314,17 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         
         # 打印问题分析部分
         print(f"\n{SUBHEADER_COLOR}{('五、' if language == 'zh' else '5. ')}{t('问题点分析')}{RESET_COLOR}")
-        print(f"{DETAIL_COLOR}{'━' * 70}{RESET_COLOR}")
+        print(f"{DETAIL_COLOR}{_RULE_THIN}{RESET_COLOR}")
         
         if not problems:
             print(f"{SUCCESS_COLOR}  ✓ {t('未发现明显问题')}{RESET_COLOR}")
             print(f"{DETAIL_COLOR}  • {t('建议：保持批判性思维，关注信息更新')}{RESET_COLOR}")
         else:
             # 按严重程度排序（严重 > 中等）
-            problems.sort(key=lambda x: 0 if x["severity"] == ("严重" if language == 'zh' else "Severe") else 1)
+            problems.sort(key=_BY_SEVERITY_RANK)
             
             for i, problem in enumerate(problems, 1):
-                color = problem["color"]
+                color = problem["color"] if use_color else ""
                 print(f"\n{color}{i}. {problem['type']}问题:{RESET_COLOR}")
                 print(f"{color}  ⚠️ 严重性：{problem['severity']}{RESET_COLOR}")
                 print(f"{color}    - {problem['description']}{RESET_COLOR}")
@@ -2083,7 +2334,7 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         warnings = result.get("警告", [])
         if warnings and isinstance(warnings, list):
             print(f"\n{SUBHEADER_COLOR}{('六、' if language == 'zh' else '6. ')}{t('系统警告')}{RESET_COLOR}")
-            print(f"{DETAIL_COLOR}{'━' * 70}{RESET_COLOR}")
+            print(f"{DETAIL_COLOR}{_RULE_THIN}{RESET_COLOR}")
             for warning in warnings:
                 if isinstance(warning, str):
                     logger.warning(f"系统警告: {warning}")
@@ -2110,9 +2361,17 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                     # 如果没有统计数据但有验证点，我们自己计算
                     verification_points = result["交叉验证"]["验证点"]
                     total_points = len(verification_points)
-                    success_count = sum(1 for p in verification_points if isinstance(p, dict) and p.get("验证评分", 0) >= 0.7)
-                    fail_count = sum(1 for p in verification_points if isinstance(p, dict) and p.get("验证评分", 0) < 0.4)
-                    no_result_count = sum(1 for p in verification_points if isinstance(p, dict) and (p.get("搜索结果数量", 0) == 0 or (0.4 <= p.get("验证评分", 0) < 0.7)))
+                    success_count = fail_count = no_result_count = 0
+                    for p in verification_points:
+                        if not isinstance(p, dict):
+                            continue
+                        point_score = p.get("验证评分", 0)
+                        if point_score >= 0.7:
+                            success_count += 1
+                        elif point_score < 0.4:
+                            fail_count += 1
+                        if p.get("搜索结果数量", 0) == 0 or 0.4 <= point_score < 0.7:
+                            no_result_count += 1
                     
                     if total_points > 0:
                         if language == 'zh':
@@ -2121,9 +2380,9 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
                             print(f"{INFO_COLOR}  ℹ️ Cross-Validation: {total_points} verification points in total, {success_count} passed, {fail_count} failed, {no_result_count} without related information{RESET_COLOR}")
         
         # 底部信息
-        print(f"\n{HEADER_COLOR}{'=' * 70}{RESET_COLOR}")
+        print(f"\n{header_banner}")
         print(f"{HEADER_COLOR}{t('分析完成 - 感谢使用新闻可信度分析工具'):^70}{RESET_COLOR}")
-        print(f"{HEADER_COLOR}{'=' * 70}{RESET_COLOR}")
+        print(header_banner)
         
         logger.info("分析报告生成完成")
         
@@ -2132,181 +2391,170 @@ def print_formatted_result(result: Dict[str, Any], colored_output: bool = True,
         logger.error(f"错误详情:\n{traceback.format_exc()}")
         print(f"{ERROR_COLOR}格式化结果时发生错误: {str(e)}{RESET_COLOR}")
         print(f"{ERROR_COLOR}错误详情:\n{traceback.format_exc()}{RESET_COLOR}")
-        # 尝试打印原始数据以便调试
-        print(f"{ERROR_COLOR}原始数据:\n{result}{RESET_COLOR}")
+        # 尝试打印原始数据以便调试，限制输出长度以免大结果刷屏
+        raw = _RAW_DUMP_REPR.repr(result)
+        if len(raw) > _RAW_DUMP_LIMIT:
+            raw = raw[:_RAW_DUMP_LIMIT] + "...[截断]"
+        print(f"{ERROR_COLOR}原始数据:\n{raw}{RESET_COLOR}")
 
 def display_detailed_results(result: Dict[str, Any], language: str = 'zh') -> None:
     """显示详细的分析结果"""
-    
-    # AI生成内容检测
-    print(f"\n{SECTION_COLOR}▶ AI生成内容检测{RESET_COLOR}")
-    if "ai_content" in result:
-        ai_content = result["ai_content"]
-        print(f"• 综合评分: {format_score(ai_content.get('score', 0))}")
-        
-        # DeepSeek多维度评分
-        if "deepseek_scores" in ai_content:
-            print(f"• DeepSeek多维度评分 (AI生成内容):")
-            scores = ai_content["deepseek_scores"]
-            print(f"  - 表达模式: {format_score(scores.get('expression_pattern', 0))}")
-            print(f"  - 词汇多样性: {format_score(scores.get('vocabulary_diversity', 0))}")
-            print(f"  - 句子变化: {format_score(scores.get('sentence_variation', 0))}")
-            print(f"  - 上下文连贯性: {format_score(scores.get('context_coherence', 0))}")
-            print(f"  - 人类特征: {format_score(scores.get('human_traits', 0))}")
-        
-        # DeepSeek分析
-        if "deepseek_analysis" in ai_content:
-            print(f"\n• DeepSeek分析: {ai_content['deepseek_analysis']}")
-    else:
-        print(f"{ERROR_COLOR}  • 错误：无法获取AI生成内容检测数据{RESET_COLOR}")
-
-    # 语言中立性
-    print(f"\n{SECTION_COLOR}▶ 语言中立性{RESET_COLOR}")
-    if "语言中立性" in result:
-        neutrality = result["语言中立性"]
-        print(f"• 综合评分: {format_score(neutrality.get('score', 0))}")
-        
-        # DeepSeek多维度评分
-        if "deepseek_scores" in neutrality:
-            print(f"• DeepSeek多维度评分 (语言中立性):")
-            scores = neutrality["deepseek_scores"]
-            print(f"  - 情感词汇: {format_score(scores.get('emotional_words', 0))}")
-            print(f"  - 情感平衡: {format_score(scores.get('sentiment_balance', 0))}")
-            print(f"  - 极端表述: {format_score(scores.get('extreme_expressions', 0))}")
-            print(f"  - 煽动性表达: {format_score(scores.get('inflammatory_expressions', 0))}")
-            print(f"  - 主观评价: {format_score(scores.get('subjective_evaluation', 0))}")
-        
-        # DeepSeek分析
-        if "deepseek_analysis" in neutrality:
-            print(f"\n• DeepSeek分析: {neutrality['deepseek_analysis']}")
-    else:
-        print(f"{ERROR_COLOR}  • 错误：无法获取语言中立性分析数据{RESET_COLOR}")
-
-    # 来源质量
-    print(f"\n{SECTION_COLOR}▶ 来源质量{RESET_COLOR}")
-    if "source_quality" in result:
-        source = result["source_quality"]
-        if "domain_trust" in source:
-            print(f"• {source['domain_trust']}")
-        if "source_count" in source:
-            print(f"• 引用了{get_source_level(source['source_count'])}的来源 ({source['source_count']}个)")
-        if "authority_sources" in source:
-            print(f"• {'发现' if source['authority_sources'] > 0 else '未发现'}权威来源引用")
-        if "direct_quotes" in source:
-            print(f"• 包含{'多个' if source['direct_quotes'] > 3 else '少量'}直接引用 ({source['direct_quotes']}个)")
-    else:
-        print(f"{ERROR_COLOR}  • 错误：无法获取来源质量分析数据{RESET_COLOR}")
-
-    # 域名可信度
-    print(f"\n{SECTION_COLOR}▶ 域名可信度{RESET_COLOR}")
-    if "domain_credibility" in result:
-        domain = result["domain_credibility"]
-        if "trust_level" in domain:
-            print(f"• {domain['trust_level']}")
-    else:
-        print(f"{ERROR_COLOR}  • 错误：无法获取域名可信度数据{RESET_COLOR}")
-
-    # 引用有效性
-    print(f"\n{SECTION_COLOR}▶ 引用有效性{RESET_COLOR}")
-    if "citation_validity" in result:
-        validity = result["citation_validity"]
-        print(f"• 引用数量: {get_citation_status(validity.get('citation_count', 0))}")
-        print(f"• 引用准确性: {validity.get('accuracy_assessment', '无法评估')}")
-        print(f"• 引用内容的真实性评估：{validity.get('authenticity_assessment', '无法评估')}")
-    else:
-        print(f"{ERROR_COLOR}  • 错误：无法获取引用有效性数据{RESET_COLOR}")
-
-    # 引用质量
-    print(f"\n{SECTION_COLOR}▶ 引用质量{RESET_COLOR}")
-    if "citation_quality" in result:
-        quality = result["citation_quality"]
-        print(f"• 引用数量: {get_quantity_level(quality.get('total_citations', 0))} (直接引语: {quality.get('direct_quotes', 0)}, 间接引用: {quality.get('indirect_quotes', 0)})")
-        print(f"• 引用来源多样性: {get_diversity_assessment(quality.get('unique_sources', 0))} (检测到{quality.get('unique_sources', 0)}个不同来源)")
-        print(f"• 引用来源权威性: {get_authority_level(quality.get('authority_sources', 0))} (检测到{quality.get('authority_sources', 0)}个权威来源)")
-        print(f"• 引用质量评估：{quality.get('overall_assessment', '无法评估')}")
-    else:
-        print(f"{ERROR_COLOR}  • 错误：无法获取引用质量数据{RESET_COLOR}")
+    # 所有分节先收集到缓冲区，最后一次性写出
+    buffer = []
+    emit = buffer.append
+    try:
+        # AI生成内容检测
+        emit(f"\n{SECTION_COLOR}▶ AI生成内容检测{RESET_COLOR}")
+        if "ai_content" in result:
+            ai_content = result["ai_content"]
+            emit(f"• 综合评分: {format_score(ai_content.get('score', 0))}")
+        
+            # DeepSeek多维度评分
+            if "deepseek_scores" in ai_content:
+                emit(f"• DeepSeek多维度评分 (AI生成内容):")
+                scores = ai_content["deepseek_scores"]
+                emit(f"  - 表达模式: {format_score(scores.get('expression_pattern', 0))}")
+                emit(f"  - 词汇多样性: {format_score(scores.get('vocabulary_diversity', 0))}")
+                emit(f"  - 句子变化: {format_score(scores.get('sentence_variation', 0))}")
+                emit(f"  - 上下文连贯性: {format_score(scores.get('context_coherence', 0))}")
+                emit(f"  - 人类特征: {format_score(scores.get('human_traits', 0))}")
+        
+            # DeepSeek分析
+            if "deepseek_analysis" in ai_content:
+                emit(f"\n• DeepSeek分析: {ai_content['deepseek_analysis']}")
+        else:
+            emit(f"{ERROR_COLOR}  • 错误：无法获取AI生成内容检测数据{RESET_COLOR}")
 
-    # 本地新闻验证
-    print(f"\n{SECTION_COLOR}▶ 本地新闻验证{RESET_COLOR}")
-    if "local_verification" in result:
-        local = result["local_verification"]
-        print(f"• {local.get('assessment', '未发现明显的本地相关性指标')}")
-    else:
-        print(f"{ERROR_COLOR}  • {t('错误：无法获取本地新闻验证数据')}{RESET_COLOR}")
-
-    # 逻辑分析
-    print(f"\n{SECTION_COLOR}{t('▶ 逻辑分析')}{RESET_COLOR}")
-    if "logic_analysis" in result:
-        logic = result["logic_analysis"]
-        for point in logic.get("points", []):
-            print(f"• {point}")
-    else:
-        print(f"{ERROR_COLOR}  • {t('错误：无法获取逻辑分析数据')}{RESET_COLOR}")
-
-    # 交叉验证
-    print(f"\n{SECTION_COLOR}{t('▶ 交叉验证')}{RESET_COLOR}")
-    if "cross_validation" in result:
-        cross = result["cross_validation"]
-        if "source_count" in cross:
-            # 直接使用条件判断处理不同语言版本
-            if language == 'zh':
-                print(f"• 搜索到了{cross['unique_sources']}个不同来源的{cross['source_count']}篇报道")
-            else:
-                print(f"• Found {cross['source_count']} reports from {cross['unique_sources']} different sources")
-        if "timeliness" in cross:
-            print(f"• {cross['timeliness']}")
-        if "source_credibility" in cross:
-            print(f"• {cross['source_credibility']}")
-    else:
-        print(f"{ERROR_COLOR}  • {t('错误：无法获取交叉验证数据')}{RESET_COLOR}")
+        # 语言中立性
+        emit(f"\n{SECTION_COLOR}▶ 语言中立性{RESET_COLOR}")
+        if "语言中立性" in result:
+            neutrality = result["语言中立性"]
+            emit(f"• 综合评分: {format_score(neutrality.get('score', 0))}")
+        
+            # DeepSeek多维度评分
+            if "deepseek_scores" in neutrality:
+                emit(f"• DeepSeek多维度评分 (语言中立性):")
+                scores = neutrality["deepseek_scores"]
+                emit(f"  - 情感词汇: {format_score(scores.get('emotional_words', 0))}")
+                emit(f"  - 情感平衡: {format_score(scores.get('sentiment_balance', 0))}")
+                emit(f"  - 极端表述: {format_score(scores.get('extreme_expressions', 0))}")
+                emit(f"  - 煽动性表达: {format_score(scores.get('inflammatory_expressions', 0))}")
+                emit(f"  - 主观评价: {format_score(scores.get('subjective_evaluation', 0))}")
+        
+            # DeepSeek分析
+            if "deepseek_analysis" in neutrality:
+                emit(f"\n• DeepSeek分析: {neutrality['deepseek_analysis']}")
+        else:
+            emit(f"{ERROR_COLOR}  • 错误：无法获取语言中立性分析数据{RESET_COLOR}")
+
+        # 来源质量
+        emit(f"\n{SECTION_COLOR}▶ 来源质量{RESET_COLOR}")
+        if "source_quality" in result:
+            source = result["source_quality"]
+            if "domain_trust" in source:
+                emit(f"• {source['domain_trust']}")
+            if "source_count" in source:
+                emit(f"• 引用了{get_source_level(source['source_count'])}的来源 ({source['source_count']}个)")
+            if "authority_sources" in source:
+                emit(f"• {'发现' if source['authority_sources'] > 0 else '未发现'}权威来源引用")
+            if "direct_quotes" in source:
+                emit(f"• 包含{'多个' if source['direct_quotes'] > 3 else '少量'}直接引用 ({source['direct_quotes']}个)")
+        else:
+            emit(f"{ERROR_COLOR}  • 错误：无法获取来源质量分析数据{RESET_COLOR}")
+
+        # 域名可信度
+        emit(f"\n{SECTION_COLOR}▶ 域名可信度{RESET_COLOR}")
+        if "domain_credibility" in result:
+            domain = result["domain_credibility"]
+            if "trust_level" in domain:
+                emit(f"• {domain['trust_level']}")
+        else:
+            emit(f"{ERROR_COLOR}  • 错误：无法获取域名可信度数据{RESET_COLOR}")
+
+        # 引用有效性
+        emit(f"\n{SECTION_COLOR}▶ 引用有效性{RESET_COLOR}")
+        if "citation_validity" in result:
+            validity = result["citation_validity"]
+            emit(f"• 引用数量: {get_citation_status(validity.get('citation_count', 0))}")
+            emit(f"• 引用准确性: {validity.get('accuracy_assessment', '无法评估')}")
+            emit(f"• 引用内容的真实性评估：{validity.get('authenticity_assessment', '无法评估')}")
+        else:
+            emit(f"{ERROR_COLOR}  • 错误：无法获取引用有效性数据{RESET_COLOR}")
+
+        # 引用质量
+        emit(f"\n{SECTION_COLOR}▶ 引用质量{RESET_COLOR}")
+        if "citation_quality" in result:
+            quality = result["citation_quality"]
+            emit(f"• 引用数量: {get_quantity_level(quality.get('total_citations', 0))} (直接引语: {quality.get('direct_quotes', 0)}, 间接引用: {quality.get('indirect_quotes', 0)})")
+            emit(f"• 引用来源多样性: {get_diversity_assessment(quality.get('unique_sources', 0))} (检测到{quality.get('unique_sources', 0)}个不同来源)")
+            emit(f"• 引用来源权威性: {get_authority_level(quality.get('authority_sources', 0))} (检测到{quality.get('authority_sources', 0)}个权威来源)")
+            emit(f"• 引用质量评估：{quality.get('overall_assessment', '无法评估')}")
+        else:
+            emit(f"{ERROR_COLOR}  • 错误：无法获取引用质量数据{RESET_COLOR}")
+
+        # 本地新闻验证
+        emit(f"\n{SECTION_COLOR}▶ 本地新闻验证{RESET_COLOR}")
+        if "local_verification" in result:
+            local = result["local_verification"]
+            emit(f"• {local.get('assessment', '未发现明显的本地相关性指标')}")
+        else:
+            emit(f"{ERROR_COLOR}  • {t('错误：无法获取本地新闻验证数据')}{RESET_COLOR}")
+
+        # 逻辑分析
+        emit(f"\n{SECTION_COLOR}{t('▶ 逻辑分析')}{RESET_COLOR}")
+        if "logic_analysis" in result:
+            logic = result["logic_analysis"]
+            for point in logic.get("points", []):
+                emit(f"• {point}")
+        else:
+            emit(f"{ERROR_COLOR}  • {t('错误：无法获取逻辑分析数据')}{RESET_COLOR}")
+
+        # 交叉验证
+        emit(f"\n{SECTION_COLOR}{t('▶ 交叉验证')}{RESET_COLOR}")
+        if "cross_validation" in result:
+            cross = result["cross_validation"]
+            if "source_count" in cross:
+                # 直接使用条件判断处理不同语言版本
+                if language == 'zh':
+                    emit(f"• 搜索到了{cross['unique_sources']}个不同来源的{cross['source_count']}篇报道")
+                else:
+                    emit(f"• Found {cross['source_count']} reports from {cross['unique_sources']} different sources")
+            if "timeliness" in cross:
+                emit(f"• {cross['timeliness']}")
+            if "source_credibility" in cross:
+                emit(f"• {cross['source_credibility']}")
+        else:
+            emit(f"{ERROR_COLOR}  • {t('错误：无法获取交叉验证数据')}{RESET_COLOR}")
+    finally:
+        _write_lines(buffer)
+        sys.stdout.flush()
+
+def _count_level(count: int, table: tuple) -> str:
+    """按阈值表返回数量所在区间的等级"""
+    thresholds, levels = table
+    return levels[bisect_right(thresholds, count)]
 
 def get_source_level(count: int) -> str:
     if count == 0:
         return t("无")
-    elif count < 3:
-        return t("有限")
-    elif count < 5:
-        return t("适量")
-    else:
-        return t("充足")
+    return t(_count_level(count, _SOURCE_LEVEL_TABLE))
 
 def get_citation_status(count: int) -> str:
     if count == 0:
         return t("无明确引用")
-    elif count < 3:
-        return f"{t('较少')} ({count}{t('个')})"
-    elif count < 5:
-        return f"{t('适量')} ({count}{t('个')})"
-    else:
-        return f"{t('充足')} ({count}{t('个')})"
+    return f"{t(_count_level(count, _QUANTITY_LEVEL_TABLE))} ({count}{t('个')})"
 
 def get_quantity_level(count: int) -> str:
     if count == 0:
         return t("无")
-    elif count < 3:
-        return t("较少")
-    elif count < 5:
-        return t("适量")
-    else:
-        return t("充足")
+    return t(_count_level(count, _QUANTITY_LEVEL_TABLE))
 
 def get_diversity_assessment(count: int) -> str:
     if count == 0:
         return t("无法评估")
-    elif count < 2:
-        return t("单一")
-    elif count < 4:
-        return t("一般")
-    else:
-        return t("多样")
+    return t(_count_level(count, _DIVERSITY_LEVEL_TABLE))
 
 def get_authority_level(count: int) -> str:
     if count == 0:
         return t("低")
-    elif count < 2:
-        return t("一般")
-    elif count < 4:
-        return t("较高")
-    else:
-        return t("高") 
\ No newline at end of file
+    return t(_count_level(count, _AUTHORITY_LEVEL_TABLE))
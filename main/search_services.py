@@ -4,26 +4,135 @@
 import logging
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import re
+import reprlib
 import time
 import random
-import traceback
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from types import MappingProxyType
 from urllib.parse import quote_plus
 
+# 优先使用orjson解析JSON响应（更快），未安装时退回标准库json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 # 全局变量，用于标记API是否可用
 SEARXNG_AVAILABLE = False
 
 # 公共SearXNG实例列表，在本地实例不可用时可以尝试使用（其实都不可用）
-PUBLIC_SEARXNG_INSTANCES = [
+PUBLIC_SEARXNG_INSTANCES = (
     "https://searx.be",
     "https://search.mdosch.de",
     "https://search.ononoki.org",
     "https://searx.tiekoetter.com",
     "https://searx.gnu.style"
-]
+)
+
+# 请求超时：(连接超时, 读取超时)，连接不上的实例几秒内即可放弃，无响应的实例10秒后放弃
+_PROBE_TIMEOUT = (3.05, 10)
+_SEARCH_TIMEOUT = (3.05, 10)
+
+class _FullJitterRetry(Retry):
+    """退避时间在[0, 指数退避上限]内均匀随机（full jitter），避免多个线程同时重试同一实例"""
+    
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        return random.uniform(0, backoff) if backoff > 0 else 0
+
+# 搜索请求在连接适配器层面的重试：429限流和5xx响应最多重试3次并指数退避（上限由urllib3限制），
+# 429/503响应带Retry-After时按其等待；连接失败和读取超时各只重试1次，
+# 无响应的实例最多占用一个线程约2次读取超时（20秒）加退避时间（连接检测不使用此重试策略）
+_RETRY = _FullJitterRetry(
+    total=3,
+    connect=1,
+    read=1,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False,
+)
+
+# 模拟浏览器的请求头，所有请求共用的部分设置在会话上，各请求只传不同的字段
+_BASE_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-User": "?1",
+    "Upgrade-Insecure-Requests": "1"
+})
+_PROBE_HEADERS = MappingProxyType({
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Sec-Fetch-Site": "none",
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache"
+})
+_SEARCH_HEADERS = MappingProxyType({
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Sec-Fetch-Site": "same-origin",
+    "Cache-Control": "max-age=0"
+})
+
+# 所有SearXNG请求共用一个会话，复用连接池（keep-alive），避免每次请求重新建立TCP/TLS连接
+_SESSION = requests.Session()
+_SESSION.headers.update(_BASE_HEADERS)
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_RETRY)
+_SESSION.mount("http://", _HTTP_ADAPTER)
+_SESSION.mount("https://", _HTTP_ADAPTER)
+
+# 连接检测使用单独的会话且不重试：无响应的实例最多阻塞一次超时，只有搜索请求使用重试策略
+_PROBE_SESSION = requests.Session()
+_PROBE_SESSION.headers.update(_BASE_HEADERS)
+_PROBE_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0)
+_PROBE_SESSION.mount("http://", _PROBE_ADAPTER)
+_PROBE_SESSION.mount("https://", _PROBE_ADAPTER)
+
+# 引用文本分析使用的正则表达式，导入时编译一次
+_RE_NUM = re.compile(r'\d+(?:\.\d+)?%?')
+_RE_SRC = re.compile(r'(根据|据|引用|来自|来源)[\s:：]?([^，,。.]{2,}?)(称|表示|指出|报道|说)')
+# _RE_SRC的前缀词和结尾词，两类都出现时才需要运行正则（"根据"已包含"据"）
+_SRC_PREFIXES = ('据', '引用', '来自', '来源')
+_SRC_SUFFIXES = ('称', '表示', '指出', '报道', '说')
+
+# 专业术语（均为小写），合并为一个正则一次扫描；使用前瞻匹配，相互重叠的术语也都能找到
+_SCIENTIFIC_TERMS = ('研究', '发现', '分析', '数据', '实验', '证明', '报告',
+                     'study', 'research', 'analysis', 'data', 'experiment', 'evidence')
+_RE_SCI_TERMS = re.compile('(?=(%s))' % '|'.join(map(re.escape, _SCIENTIFIC_TERMS)))
+
+# 连接检测结果的缓存时间（秒），避免频繁调用时反复探测实例
+_PROBE_TTL = 60.0
+
+class _ProbeState:
+    """
+    连接检测的缓存状态
+    
+    snapshot为(检测时间, 检测结果)元组，每次整体替换，读取时不会拿到不一致的时间和结果；
+    lock保证同一时间只有一个线程在探测实例，并发调用者等待并复用这次探测的结果。
+    """
+    lock = threading.Lock()
+    snapshot = None
+
+# 搜索结果缓存：最多缓存的查询数和有效期（秒）
+_QUERY_CACHE_SIZE = 1024
+_QUERY_CACHE_TTL = 300.0
+
+# 引用验证查询的最大UTF-8字节数
+_QUERY_MAX_BYTES = 200
+
+# 批量验证引用时的最大并发数：所有请求发往同一实例，并发过高容易触发429限流
+_VERIFY_MAX_WORKERS = 3
 
 # 导入配置
 try:
@@ -38,18 +147,38 @@ def query_searxng(query, max_retries=3, num_results=5):
     
     参数:
         query (str): 搜索查询
-        max_retries (int): 最大重试次数
+        max_retries (int): 最大重试次数（保留以兼容旧调用，重试由_SESSION的连接适配器统一处理）
         num_results (int): 返回结果数量
     
     返回:
         list: 搜索结果列表，每个结果包含标题、URL和摘要
     """
+    # 每次返回新的字典列表，调用方修改结果不会影响缓存
+    return list(iter_searxng(query, num_results=num_results))
+
+def iter_searxng(query, num_results=5):
+    """
+    使用SearXNG搜索引擎进行查询，逐条生成搜索结果
+    
+    只需要判断是否有结果或只取前几条时，不必构建完整的结果列表。
+    
+    参数:
+        query (str): 搜索查询
+        num_results (int): 最多返回的结果数量
     
+    返回:
+        generator: 逐条生成包含标题、URL和摘要的字典
+    """
+    for title, url, content in _search_searxng(query, num_results):
+        yield {"title": title, "url": url, "content": content}
+
+def _search_searxng(query, num_results):
+    """执行SearXNG查询，返回(标题, URL, 摘要)元组组成的元组，不可用或失败时返回空元组"""
     # 检查SearXNG是否可用
     global SEARXNG_AVAILABLE
     if not SEARXNG_AVAILABLE:
         logger.warning("SearXNG已被标记为不可用，跳过查询")
-        return []
+        return ()
     
     # 从配置中获取SearXNG URL
     from config import SEARXNG_URL
@@ -67,159 +196,79 @@ def query_searxng(query, max_retries=3, num_results=5):
     if not searxng_base_url.startswith(('http://', 'https://')):
         searxng_base_url = 'http://' + searxng_base_url
     
+    logger.info("使用SearXNG实例: %s", searxng_base_url)
+    
+    # 实例可用性已由test_searxng_connection检测，这里直接发送搜索请求
+    # 连接错误、429和5xx响应的重试（含指数退避）由共享会话的连接适配器处理
+    try:
+        # 相同查询在缓存有效期内直接复用结果，不再访问网络
+        # 先合并查询中的连续空白，仅空白不同的查询共用同一缓存项（搜索引擎本身也忽略这些差异）
+        query_key = " ".join(query.split())
+        ttl_bucket = int(time.monotonic() // _QUERY_CACHE_TTL)
+        return _fetch_searxng_results(searxng_base_url, query_key, num_results, ttl_bucket)
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+        # 只有实例连不上或无响应时才标记为不可用，后续查询等待重新检测
+        logger.error("SearXNG实例连接失败，标记为不可用: %s", e)
+        SEARXNG_AVAILABLE = False
+        invalidate_searxng_probe_cache()
+    except requests.exceptions.RequestException as e:
+        # 4xx/5xx等单次请求失败只放弃本次查询
+        logger.error("SearXNG请求失败: %s", e)
+    except ValueError as e:
+        # 响应不是JSON或缺少results字段，只放弃本次查询
+        logger.warning("SearXNG响应无法解析: %s", e)
+    except Exception as e:
+        logger.exception("处理SearXNG响应时出错: %s", e)
+    
+    return ()
+
+@lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _fetch_searxng_results(searxng_base_url, query, num_results, ttl_bucket):
+    """
+    发送SearXNG搜索请求并提取结果
+    
+    结果按(实例URL, 查询, 结果数量, 时间分桶)缓存，ttl_bucket只用于让缓存按时间过期。
+    请求失败或响应格式不正确时抛出异常，失败结果不会被缓存。
+    
+    返回:
+        tuple: (标题, URL, 摘要) 元组组成的元组
+    """
     # 构建API URL
     api_url = f"{searxng_base_url}/search"
     
-    logger.info(f"使用SearXNG实例: {searxng_base_url}")
+    # 设置请求头，模拟浏览器（公共字段已设置在会话上）
+    headers = {**_SEARCH_HEADERS, "Referer": searxng_base_url}
+    
+    # 设置查询参数（只取第一页结果；gzip/deflate压缩由requests默认的Accept-Encoding请求头协商）
+    params = {
+        "q": query,
+        "categories": "general",
+        "language": "zh-CN",
+        "format": "json",
+        "safesearch": "0",
+        "pageno": "1"
+    }
     
-    # 尝试连接SearXNG实例
-    try:
-        # 测试实例连接
-        session = requests.Session()
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9,zh-CN;q=0.8,zh;q=0.7",
-            "DNT": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Upgrade-Insecure-Requests": "1"
-        }
-        
-        logger.debug(f"尝试连接到SearXNG基础URL: {searxng_base_url}")
-        response = session.get(searxng_base_url, headers=headers, timeout=10)  # 增加超时时间
-        
-        # 更详细的连接检查
-        if response.status_code == 200:
-            logger.debug(f"SearXNG连接响应内容前100字符: {response.text[:100]}")
-            
-            # 检查是否包含SearXNG的特征
-            # 可能的特征包括searx, searxng, search, engine, preferences等
-            searxng_features = ['searx', 'search', 'engine', 'preferences', 'about', 'query']
-            found_features = [feature for feature in searxng_features if feature in response.text.lower()]
-            
-            if found_features:
-                logger.info(f"SearXNG实例连接成功，检测到特征: {', '.join(found_features)}")
-                # 继续执行，不要立刻返回，以便可以查询
-            else:
-                logger.warning(f"SearXNG响应不包含预期特征，可能不是SearXNG实例: {searxng_base_url}")
-                # 尝试请求一次搜索，看是否能正常工作
-                try:
-                    test_response = session.get(f"{searxng_base_url}/search?q=test&format=json", headers=headers, timeout=10)
-                    if test_response.status_code == 200:
-                        logger.info("SearXNG搜索测试成功，继续执行")
-                    else:
-                        logger.error(f"SearXNG搜索测试失败，状态码: {test_response.status_code}")
-                        SEARXNG_AVAILABLE = False
-                        return []
-                except Exception as test_e:
-                    logger.error(f"SearXNG搜索测试异常: {test_e}")
-                    SEARXNG_AVAILABLE = False
-                    return []
-        else:
-            # 如果实例不可用，设置为不可用并返回
-            logger.error(f"SearXNG实例返回非200状态码: {response.status_code}")
-            SEARXNG_AVAILABLE = False
-            return []
-    except Exception as e:
-        # 如果实例连接失败，设置为不可用并返回
-        logger.error(f"SearXNG实例连接失败: {str(e)}")
-        SEARXNG_AVAILABLE = False
-        return []
+    logger.debug("发送SearXNG请求")
     
-    # 创建一个新的会话，避免连接池问题
-    session = requests.Session()
+    # 使用共享会话发送请求
+    response = _SESSION.get(api_url, headers=headers, params=params, timeout=_SEARCH_TIMEOUT)
+    response.raise_for_status()
     
-    # 发送请求
-    for attempt in range(max_retries + 1):
-        try:
-            logger.debug(f"发送SearXNG请求，尝试 {attempt+1}/{max_retries+1}")
-            
-            # 添加随机延迟，避免请求过于频繁
-            if attempt > 0:
-                delay = 2 + random.uniform(0, 2)
-                logger.info(f"等待 {delay:.2f} 秒后重试")
-                time.sleep(delay)
-            
-            # 设置请求头，模拟浏览器
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-                "Referer": searxng_base_url,
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Sec-Fetch-Dest": "document",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-Site": "same-origin",
-                "Sec-Fetch-User": "?1",
-                "Upgrade-Insecure-Requests": "1",
-                "Cache-Control": "max-age=0"
-            }
-            
-            # 设置查询参数
-            params = {
-                "q": query,
-                "categories": "general",
-                "language": "zh-CN",
-                "format": "json",
-                "safesearch": "0"
-            }
-            
-            # 使用新的会话发送请求
-            response = session.get(api_url, headers=headers, params=params, timeout=30)
-            response.raise_for_status()
-            
-            # 解析响应
-            result = response.json()
-            if "results" in result:
-                # 提取搜索结果
-                search_results = []
-                for item in result.get("results", [])[:num_results]:
-                    search_result = {
-                        "title": item.get("title", ""),
-                        "url": item.get("url", ""),
-                        "content": item.get("content", "")
-                    }
-                    search_results.append(search_result)
-                
-                logger.debug(f"SearXNG搜索成功，找到 {len(search_results)} 条结果")
-                return search_results
-            else:
-                logger.warning(f"SearXNG响应格式不正确: {result}")
-                # 如果到达这里，说明响应格式不正确，但API调用成功
-                # 返回空列表
-                return []
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"SearXNG请求失败: {e}")
-            if attempt < max_retries:
-                wait_time = 2 ** attempt + random.uniform(0, 2)  # 指数退避 + 随机抖动
-                logger.info(f"等待 {wait_time:.2f} 秒后重试")
-                time.sleep(wait_time)
-            else:
-                logger.error("已达到最大重试次数，放弃请求")
-                SEARXNG_AVAILABLE = False
-                return []
-        except Exception as e:
-            logger.error(f"处理SearXNG响应时出错: {e}")
-            logger.error(traceback.format_exc())
-            if attempt < max_retries:
-                wait_time = 2 ** attempt + random.uniform(0, 2)
-                logger.info(f"等待 {wait_time:.2f} 秒后重试")
-                time.sleep(wait_time)
-            else:
-                logger.error("已达到最大重试次数，放弃请求")
-                SEARXNG_AVAILABLE = False
-                return []
-        finally:
-            # 确保关闭会话
-            if 'session' in locals():
-                session.close()
+    # 解析响应
+    result = _json_loads(response.content)
+    if not isinstance(result, dict) or "results" not in result:
+        # API调用成功但响应格式不正确，抛出异常而不是返回空结果，避免空结果被缓存
+        raise ValueError(f"SearXNG响应格式不正确: {reprlib.repr(result)}")
+    
+    # 提取搜索结果
+    search_results = tuple(
+        (item.get("title", ""), item.get("url", ""), item.get("content", ""))
+        for item in result.get("results", [])[:num_results]
+    )
     
-    return []
+    logger.debug("SearXNG搜索成功，找到 %d 条结果", len(search_results))
+    return search_results
 
 def search_with_searxng(query, num_results=10):
     """
@@ -232,7 +281,7 @@ def search_with_searxng(query, num_results=10):
     返回:
         dict: 包含搜索结果的字典
     """
-    logger.info(f"使用SearXNG搜索: {query}")
+    logger.info("使用SearXNG搜索: %s", query)
     
     # 调用query_searxng获取搜索结果
     search_results = query_searxng(query, num_results=num_results)
@@ -248,10 +297,17 @@ def search_with_searxng(query, num_results=10):
     if not search_results:
         logger.warning(f"搜索查询 '{query}' 未返回任何结果")
     else:
-        logger.info(f"搜索查询 '{query}' 返回了 {len(search_results)} 个结果")
+        logger.info("搜索查询 '%s' 返回了 %d 个结果", query, len(search_results))
     
     return formatted_results
 
+def _trim_utf8(text, limit):
+    """截取text使其UTF-8编码不超过limit字节，不会截断多字节字符"""
+    encoded = text.encode('utf-8')
+    if len(encoded) <= limit:
+        return text
+    return encoded[:limit].decode('utf-8', 'ignore')
+
 def verify_citation_with_searxng(citation_text):
     """
     验证引用内容的真实性（替代方法）
@@ -262,6 +318,10 @@ def verify_citation_with_searxng(citation_text):
     返回:
         (验证结果, 相似度分数, 详细信息)
     """
+    # 清理引用文本（合并连续空白并去掉首尾空白），搜索查询和本地分析共用
+    # str.split()识别的空白字符与正则\s相同，但不经过正则引擎
+    clean_text = " ".join(citation_text.split())
+    
     # 检查SearXNG是否可用
     global SEARXNG_AVAILABLE
     
@@ -276,34 +336,25 @@ def verify_citation_with_searxng(citation_text):
         # 尝试使用SearXNG进行验证
         try:
             # 构建搜索查询 - 使用更智能的查询构建方法
-            # 提取引用文本中的关键句子或短语
-            clean_text = re.sub(r'\s+', ' ', citation_text).strip()
-            
-            # 如果文本太长，提取前100个字符作为查询
-            if len(clean_text) > 100:
-                query = clean_text[:100]
-            else:
-                query = clean_text
+            # 如果文本太长，提取前100个字符作为查询，并限制UTF-8编码后的字节数（中文每字3字节）
+            query = _trim_utf8(clean_text[:100], _QUERY_MAX_BYTES)
                 
-            logger.info(f"使用SearXNG验证引用，查询: {query}")
-            search_results = search_with_searxng(query, num_results=3)
+            logger.info("使用SearXNG验证引用，查询: %s", query)
+            # 只需判断是否有结果，取到第一条即可
+            first_result = next(iter_searxng(query, num_results=3), None)
             
-            if search_results and search_results.get("results"):
-                logger.info(f"SearXNG搜索成功，找到 {len(search_results.get('results'))} 条结果")
+            if first_result:
+                logger.info("SearXNG搜索成功，找到相关结果: %s", first_result["url"])
                 # 有搜索结果，进行简单比较
                 # 这里可以实现更复杂的比较逻辑
                 return True, 0.8, "通过SearXNG搜索找到相关内容，引用可能可信"
             else:
                 logger.warning("SearXNG搜索未找到相关结果")
         except Exception as e:
-            logger.error(f"使用SearXNG验证引用时出错: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("使用SearXNG验证引用时出错: %s", e)
             # 出错时继续使用本地分析方法
     
     # 使用本地文本分析方法
-    # 清理引用文本
-    clean_text = re.sub(r'\s+', ' ', citation_text).strip()
-    
     # 如果文本太短，不进行验证
     if len(clean_text) < 10:
         return False, 0, "引用文本太短，无法进行有效验证"
@@ -318,21 +369,23 @@ def verify_citation_with_searxng(citation_text):
         details.append("引用文本较长，含有更多细节")
     
     # 检查是否包含数字和具体数据
-    has_numbers = bool(re.search(r'\d+(\.\d+)?%?', clean_text))
+    has_numbers = bool(_RE_NUM.search(clean_text))
     if has_numbers:
         score += 0.1
         details.append("包含具体数字或统计数据")
     
-    # 检查是否包含专业术语
-    scientific_terms = ['研究', '发现', '分析', '数据', '实验', '证明', '报告', 
-                     'study', 'research', 'analysis', 'data', 'experiment', 'evidence']
-    term_count = sum(1 for term in scientific_terms if term.lower() in clean_text.lower())
+    # 检查是否包含专业术语（统计出现的不同术语个数）
+    term_count = len(set(_RE_SCI_TERMS.findall(clean_text.lower())))
     if term_count >= 2:
         score += 0.1
         details.append(f"包含 {term_count} 个专业术语，增加可信度")
     
     # 检查引用是否包含具体来源
-    sources = re.findall(r'(根据|据|引用|来自|来源)[\s:：]?([^，,。.]{2,}?)(称|表示|指出|报道|说)', clean_text)
+    if (any(prefix in clean_text for prefix in _SRC_PREFIXES)
+            and any(suffix in clean_text for suffix in _SRC_SUFFIXES)):
+        sources = _RE_SRC.findall(clean_text)
+    else:
+        sources = []
     if sources:
         score += 0.1
         source_text = sources[0][1] if len(sources[0]) > 1 else sources[0][0]
@@ -359,13 +412,63 @@ def verify_citation_with_searxng(citation_text):
     
     return verified, score, explanation
 
+def verify_citations_with_searxng(citation_texts, max_workers=_VERIFY_MAX_WORKERS):
+    """
+    并发验证多条引用内容
+    
+    各引用的网络请求相互独立，使用线程池并发发送，总耗时接近单次请求而不是逐条累加。
+    
+    参数:
+        citation_texts: 引用文本列表
+        max_workers (int): 最大并发数
+    
+    返回:
+        list: 与输入顺序一致的 (验证结果, 相似度分数, 详细信息) 列表
+    """
+    citation_texts = list(citation_texts)
+    if len(citation_texts) <= 1:
+        return [verify_citation_with_searxng(text) for text in citation_texts]
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(citation_texts))) as executor:
+        return list(executor.map(verify_citation_with_searxng, citation_texts))
+
 def test_searxng_connection():
     """
     测试SearXNG连接是否正常
     
+    检测结果会缓存_PROBE_TTL秒，期间重复调用直接返回上次结果。
+    多个线程同时调用时只进行一次探测。
+    
     返回:
         bool: 连接是否成功
     """
+    cached = _cached_probe_result()
+    if cached is not None:
+        return cached
+    
+    with _ProbeState.lock:
+        # 等待锁期间其他线程可能已完成探测
+        cached = _cached_probe_result()
+        if cached is not None:
+            return cached
+        
+        result = _probe_searxng_connection()
+        _ProbeState.snapshot = (time.monotonic(), result)
+        return result
+
+def _cached_probe_result():
+    """返回仍在有效期内的检测结果，没有缓存或已过期时返回None"""
+    snapshot = _ProbeState.snapshot
+    if snapshot is not None and time.monotonic() - snapshot[0] < _PROBE_TTL:
+        return snapshot[1]
+    return None
+
+def invalidate_searxng_probe_cache():
+    """清除连接检测缓存，下次调用test_searxng_connection时重新探测（例如修改配置后）"""
+    _ProbeState.snapshot = None
+
+def _probe_searxng_connection():
+    """实际探测配置的SearXNG实例，必要时尝试公共实例"""
     global SEARXNG_AVAILABLE
     
     logging.info("测试SearXNG连接...")
@@ -386,7 +489,7 @@ def test_searxng_connection():
     if not searxng_base_url.startswith(('http://', 'https://')):
         searxng_base_url = 'http://' + searxng_base_url
     
-    logging.info(f"使用SearXNG基础URL: {searxng_base_url}")
+    logging.info("使用SearXNG基础URL: %s", searxng_base_url)
     
     # 尝试连接配置的SearXNG实例
     local_instance_available = test_specific_searxng_instance(searxng_base_url)
@@ -395,11 +498,23 @@ def test_searxng_connection():
     if not local_instance_available and USE_PUBLIC_SEARXNG:
         logging.warning(f"本地SearXNG实例 {searxng_base_url} 不可用，尝试使用公共实例")
         
-        for instance in PUBLIC_SEARXNG_INSTANCES:
-            logging.info(f"尝试公共SearXNG实例: {instance}")
-            if test_specific_searxng_instance(instance):
-                logging.info(f"成功连接到公共SearXNG实例: {instance}")
-                return True
+        # 并发探测所有公共实例，任一可用即返回，耗时取决于最慢的单个探测而不是总和
+        executor = ThreadPoolExecutor(max_workers=len(PUBLIC_SEARXNG_INSTANCES))
+        try:
+            futures = {}
+            for instance in PUBLIC_SEARXNG_INSTANCES:
+                logging.info("尝试公共SearXNG实例: %s", instance)
+                futures[executor.submit(test_specific_searxng_instance, instance)] = instance
+            
+            for future in as_completed(futures):
+                if future.result():
+                    logging.info("成功连接到公共SearXNG实例: %s", futures[future])
+                    for pending in futures:
+                        pending.cancel()
+                    return True
+        finally:
+            # 不等待仍在进行的探测，避免找到可用实例后继续阻塞
+            executor.shutdown(wait=False)
         
         logging.error("所有公共SearXNG实例均不可用")
         SEARXNG_AVAILABLE = False
@@ -420,102 +535,29 @@ def test_specific_searxng_instance(searxng_base_url):
     global SEARXNG_AVAILABLE
     
     try:
-        # 创建一个新的会话
-        session = requests.Session()
-        
-        # 设置请求头，模拟浏览器
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Upgrade-Insecure-Requests": "1",
-            "Cache-Control": "no-cache",
-            "Pragma": "no-cache"
-        }
+        # 直接请求一次JSON格式的搜索，返回200且内容类型为JSON即说明实例可用且支持JSON输出
+        # 使用stream=True只读取响应头，不下载和解析搜索结果正文
+        search_url = f"{searxng_base_url}/search"
+        test_params = {"q": "test", "format": "json"}
         
-        # 发送请求到基础URL
-        logging.info(f"尝试连接到 {searxng_base_url}")
-        response = session.get(searxng_base_url, headers=headers, timeout=10)  # 增加超时时间
-        
-        # 检查响应状态码
-        if response.status_code != 200:
-            logging.warning(f"SearXNG连接测试返回非200状态码: {response.status_code}")
-            return False
+        logging.info("测试SearXNG搜索功能: %s", search_url)
+        test_response = _PROBE_SESSION.get(search_url, params=test_params, headers=_PROBE_HEADERS,
+                                           timeout=_PROBE_TIMEOUT, stream=True)
+        try:
+            if test_response.status_code != 200:
+                logging.warning(f"SearXNG搜索测试返回非200状态码: {test_response.status_code}")
+                return False
             
-        # 检查响应是否包含SearXNG的特征
-        response_text = response.text.lower()
-        logging.debug(f"SearXNG响应内容前100字符: {response_text[:100]}")
-        
-        # 更详细的特征检查
-        searxng_features = ['searx', 'search', 'engine', 'preferences', 'about', 'query']
-        found_features = [feature for feature in searxng_features if feature in response_text]
+            content_type = test_response.headers.get("Content-Type", "")
+            if "json" not in content_type:
+                logging.warning(f"SearXNG搜索结果不是JSON格式: {content_type}")
+                return False
+        finally:
+            test_response.close()
         
-        if found_features:
-            logging.info(f"SearXNG实例连接成功，检测到特征: {', '.join(found_features)}")
-            
-            # 尝试进行一次简单搜索，确保搜索功能正常
-            try:
-                # 构建搜索URL
-                search_url = f"{searxng_base_url}/search"
-                test_params = {"q": "test", "format": "json"}
-                
-                logging.info(f"测试SearXNG搜索功能: {search_url}")
-                test_response = session.get(search_url, params=test_params, headers=headers, timeout=10)
-                
-                if test_response.status_code == 200:
-                    try:
-                        result = test_response.json()
-                        if "results" in result:
-                            logging.info(f"SearXNG搜索功能测试成功，结果数: {len(result.get('results', []))}")
-                            SEARXNG_AVAILABLE = True
-                            return True
-                        else:
-                            logging.warning("SearXNG搜索结果不包含'results'字段")
-                            # 尝试查看返回内容
-                            logging.debug(f"响应内容前100字符: {test_response.text[:100]}")
-                    except Exception as e:
-                        logging.warning(f"SearXNG搜索结果解析失败: {str(e)}")
-                        logging.debug(f"响应内容前100字符: {test_response.text[:100]}")
-                else:
-                    logging.warning(f"SearXNG搜索测试返回非200状态码: {test_response.status_code}")
-            except Exception as e:
-                logging.warning(f"SearXNG搜索功能测试失败: {str(e)}")
-            
-            # 即使搜索测试失败，如果基本连接成功且找到特征，仍然标记为可用
-            logging.info("基于基础连接成功，标记SearXNG为可用")
-            SEARXNG_AVAILABLE = True
-            return True
-        else:
-            # 如果没有找到特征，尝试直接测试搜索端点
-            try:
-                search_url = f"{searxng_base_url}/search"
-                test_params = {"q": "test", "format": "json"}
-                
-                logging.info(f"直接测试SearXNG搜索端点: {search_url}")
-                test_response = session.get(search_url, params=test_params, headers=headers, timeout=10)
-                
-                if test_response.status_code == 200:
-                    try:
-                        result = test_response.json()
-                        if "results" in result:
-                            logging.info("SearXNG搜索端点测试成功，标记为可用")
-                            SEARXNG_AVAILABLE = True
-                            return True
-                    except Exception as e:
-                        logging.warning(f"解析SearXNG搜索端点响应失败: {str(e)}")
-                
-                logging.warning("SearXNG搜索端点测试失败")
-            except Exception as e:
-                logging.warning(f"访问SearXNG搜索端点出错: {str(e)}")
-                
-            logging.warning("SearXNG连接测试返回意外响应，未找到SearXNG特征")
-            return False
+        logging.info("SearXNG搜索功能测试成功")
+        SEARXNG_AVAILABLE = True
+        return True
     except requests.exceptions.ConnectionError as e:
         logging.error(f"SearXNG连接失败 (连接错误): {str(e)}")
         return False
@@ -523,13 +565,8 @@ def test_specific_searxng_instance(searxng_base_url):
         logging.error(f"SearXNG连接超时: {str(e)}")
         return False
     except Exception as e:
-        logging.error(f"SearXNG连接测试失败: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("SearXNG连接测试失败: %s", e)
         return False
-    finally:
-        # 确保关闭会话
-        if 'session' in locals():
-            session.close()
 
 # 模块初始化时测试 SearXNG 连接
 try:
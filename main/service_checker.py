@@ -7,6 +7,7 @@
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 from config import (
     colorama_available, Fore, Style,
@@ -34,9 +35,15 @@ def initialize_services():
         "affected_features": []
     }
     
+    # 两项服务的连接测试相互独立，并发执行，总耗时取决于较慢的一项
+    # future.result()会重新抛出测试中的异常，由下面各自的except处理
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        deepseek_future = executor.submit(test_deepseek_connection)
+        searxng_future = executor.submit(test_searxng_connection)
+    
     # 测试DeepSeek API连接
     try:
-        if test_deepseek_connection():
+        if deepseek_future.result():
             services_status["deepseek_api"] = True
             logger.info("DeepSeek API连接测试成功")
         else:
@@ -72,7 +79,7 @@ def initialize_services():
     
     # 测试SearXNG连接
     try:
-        if test_searxng_connection():
+        if searxng_future.result():
             services_status["searxng"] = True
             logger.info("SearXNG连接测试成功")
         else:
@@ -5,6 +5,7 @@ import logging
 import os
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 
 # 导入本地模块
@@ -39,6 +40,21 @@ def simple_test():
     可再生能源行业。"多位行业专家对此表示认可，但也指出从实验室到商业化还有很长的路要走。
     """
     
+    # 各项分析相互独立，先全部提交到线程池并发执行，再按原有顺序输出结果
+    # future.result()会重新抛出分析中的异常，由各部分原有的except处理
+    tasks = {
+        "ai": check_ai_content,
+        "neutrality": analyze_language_neutrality,
+        "source": analyze_source_quality,
+        "logic": analyze_text_logic,
+        "local": local_news_validation,
+        "citation_truth": judge_citation_truthfulness,
+        "citation_score": get_citation_score,
+        "credibility": local_text_credibility,
+    }
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {name: executor.submit(func, test_text) for name, func in tasks.items()}
+    
     print(colored("\n===== 功能测试开始 =====", Colors.HEADER, bold=True))
     
     # 1. 测试文本分析功能
@@ -46,23 +62,23 @@ def simple_test():
     
     try:
         print("- 检测AI生成内容...")
-        ai_score, ai_details = check_ai_content(test_text)
+        ai_score, ai_details = futures["ai"].result()
         print(f"  结果: AI内容检测评分 = {ai_score:.2f}")
         
         print("- 分析语言中立性...")
-        neutral_score, neutral_details = analyze_language_neutrality(test_text)
+        neutral_score, neutral_details = futures["neutrality"].result()
         print(f"  结果: 语言中立性评分 = {neutral_score:.2f}")
         
         print("- 分析来源质量...")
-        source_score, source_details = analyze_source_quality(test_text)
+        source_score, source_details = futures["source"].result()
         print(f"  结果: 来源质量评分 = {source_score:.2f}")
         
         print("- 分析文本逻辑性...")
-        logic_score, logic_details = analyze_text_logic(test_text)
+        logic_score, logic_details = futures["logic"].result()
         print(f"  结果: 文本逻辑性评分 = {logic_score:.2f}")
         
         print("- 本地新闻验证...")
-        local_score, local_details = local_news_validation(test_text)
+        local_score, local_details = futures["local"].result()
         print(f"  结果: 本地新闻验证评分 = {local_score:.2f}")
         
         print(colored("  文本分析功能测试通过", Colors.GREEN))
@@ -74,11 +90,11 @@ def simple_test():
     
     try:
         print("- 判断引用真实性...")
-        citation_truth = judge_citation_truthfulness(test_text)
+        citation_truth = futures["citation_truth"].result()
         print(f"  结果: 引用真实性评分 = {citation_truth['score'] if isinstance(citation_truth, dict) and 'score' in citation_truth else citation_truth[0]:.2f}")
         
         print("- 获取引用质量评分...")
-        citation_score, citation_details = get_citation_score(test_text)
+        citation_score, citation_details = futures["citation_score"].result()
         print(f"  结果: 引用质量总评分 = {citation_score:.2f}")
         print(f"  详情: {str(citation_details)[:100]}...")
         
@@ -91,7 +107,7 @@ def simple_test():
     
     try:
         print("- 执行本地文本可信度评估...")
-        credibility_score, credibility_details = local_text_credibility(test_text)
+        credibility_score, credibility_details = futures["credibility"].result()
         print(f"  结果: 本地可信度评分 = {credibility_score:.2f}")
         
         print(colored("  本地可信度评估测试通过", Colors.GREEN))
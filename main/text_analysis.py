@@ -10,11 +10,68 @@ import logging
 import re
 import traceback
 from typing import Tuple, Dict, Any, List, Optional
-from utils import find_common_substrings
+from utils import find_repeated_phrases
 
 # 初始化logger
 logger = logging.getLogger(__name__)
 
+# 句子分隔符
+_SENT_SPLIT_RE = re.compile(r'[。！？.!?]')
+
+# 常见AI表达方式
+_AI_PATTERN_RES = tuple(re.compile(pattern, re.DOTALL) for pattern in (
+    r"首先.*其次.*最后",
+    r"一方面.*另一方面",
+    r"不仅.*而且",
+    r"总的来说",
+    r"总而言之",
+    r"综上所述"
+))
+
+# 来源指示词
+_SOURCE_INDICATOR_RES = tuple(re.compile(pattern) for pattern in (
+    "据.*?报道", "来自.*?的消息", "根据.*?的数据", "引用.*?的话",
+    "参考.*?的研究", "援引.*?的说法", "来源于.*?", "出自.*?",
+    "记者.*?报道", "通讯员.*?报道", "特约记者.*?", "本报记者.*?",
+    "报道称", "消息称", "消息人士称", "知情人士透露",
+    "according to", "reported by", "cited by", "quoted by",
+    "sources said", "officials said", "experts said", "researchers found"
+))
+
+# 引号中的引用内容
+_QUOTE_RES = tuple(re.compile(pattern) for pattern in (
+    r'"([^"]+)"',                      # 英文双引号
+    r"'([^']+)'",                      # 英文单引号
+    r"「([^」]+)」",                    # 中文单引号
+    r"『([^』]+)』",                    # 中文双引号
+    r"【([^】]+)】",                    # 中文方括号
+    r"《([^》]+)》"                     # 中文书名号
+))
+
+# 数据和统计信息
+_DATA_RES = tuple(re.compile(pattern) for pattern in (
+    r'\d+(?:\.\d+)?%',                 # 百分比
+    r'\d+(?:\.\d+)?\s*(?:亿|万|千|百)',  # 中文数量单位
+    r'\d+(?:\.\d+)?\s*(?:million|billion|thousand)', # 英文数量单位
+    r'增长\s*\d+(?:\.\d+)?%',           # 增长率
+    r'下降\s*\d+(?:\.\d+)?%',           # 下降率
+    r'上升\s*\d+(?:\.\d+)?%'            # 上升率
+))
+
+# 逻辑连接词
+_LOGIC_CONNECTORS = (
+    "因为", "所以", "因此", "由于", "如果", "那么", "但是", "然而",
+    "虽然", "尽管", "不过", "否则", "除非", "只有", "首先", "其次",
+    "最后", "总之", "换言之", "例如", "比如", "特别是", "尤其是"
+)
+
+# 矛盾词对
+_CONTRADICTION_PAIRS = (
+    ("增加", "减少"), ("上升", "下降"), ("提高", "降低"),
+    ("加强", "减弱"), ("扩大", "缩小"), ("加速", "减速"),
+    ("肯定", "否定"), ("支持", "反对"), ("赞成", "反对")
+)
+
 def check_ai_content(text: str) -> Tuple[float, List[str]]:
     """
     检测文本是否由AI生成
@@ -43,7 +100,7 @@ def check_ai_content(text: str) -> Tuple[float, List[str]]:
     
     # 1. 句式结构分析
     # 检测过于规整的句式结构
-    sentences = re.split(r'[。！？.!?]', text)
+    sentences = _SENT_SPLIT_RE.split(text)
     sentences = [s.strip() for s in sentences if len(s.strip()) > 5]
     
     if not sentences:
@@ -63,19 +120,8 @@ def check_ai_content(text: str) -> Tuple[float, List[str]]:
     
     # 2. 重复模式检测
     # 检查重复的短语和表达
-    phrases = []
-    for i in range(len(sentences) - 1):
-        for j in range(i + 1, len(sentences)):
-            common_substrings = find_common_substrings(sentences[i], sentences[j], min_length=5)
-            phrases.extend(common_substrings)
-    
-    # 统计重复短语
-    phrase_counts = {}
-    for phrase in phrases:
-        if phrase in phrase_counts:
-            phrase_counts[phrase] += 1
-        else:
-            phrase_counts[phrase] = 1
+    # 统计重复短语（短语 -> 出现该短语的句子数）
+    phrase_counts = find_repeated_phrases(sentences, min_length=5)
     
     # 过滤掉常见短语
     common_phrases = ["因此", "所以", "然而", "但是", "此外", "另外", "总之", "总的来说", "最后"]
@@ -87,18 +133,9 @@ def check_ai_content(text: str) -> Tuple[float, List[str]]:
         human_indicators.append("未检测到明显重复表达模式")
     
     # 3. 常见AI表达方式识别
-    ai_patterns = [
-        r"首先.*其次.*最后",
-        r"一方面.*另一方面",
-        r"不仅.*而且",
-        r"总的来说",
-        r"总而言之",
-        r"综上所述"
-    ]
-    
     ai_pattern_matches = 0
-    for pattern in ai_patterns:
-        if re.search(pattern, text, re.DOTALL):
+    for pattern in _AI_PATTERN_RES:
+        if pattern.search(text):
             ai_pattern_matches += 1
     
     if ai_pattern_matches >= 3:
@@ -215,11 +252,11 @@ def analyze_language_neutrality(text: str) -> Tuple[float, List[str]]:
     ]
     
     # 统计各类词汇出现次数
-    positive_count = sum(1 for word in positive_words if word in text)
-    negative_count = sum(1 for word in negative_words if word in text)
-    extreme_count = sum(1 for word in extreme_words if word in text)
-    inflammatory_count = sum(1 for word in inflammatory_words if word in text)
-    subjective_count = sum(1 for phrase in subjective_phrases if phrase in text)
+    positive_count = sum(map(text.__contains__, positive_words))
+    negative_count = sum(map(text.__contains__, negative_words))
+    extreme_count = sum(map(text.__contains__, extreme_words))
+    inflammatory_count = sum(map(text.__contains__, inflammatory_words))
+    subjective_count = sum(map(text.__contains__, subjective_phrases))
     
     # 计算总情感词数量
     total_emotional_words = positive_count + negative_count + extreme_count
@@ -363,21 +400,10 @@ def analyze_source_quality(text: str, url: Optional[str] = None) -> Tuple[float,
         score = 0.4 * domain_score + 0.6 * score
         details.append(domain_details)
     
-    # 提取可能的来源指示词
-    source_indicators = [
-        "据.*?报道", "来自.*?的消息", "根据.*?的数据", "引用.*?的话",
-        "参考.*?的研究", "援引.*?的说法", "来源于.*?", "出自.*?",
-        "记者.*?报道", "通讯员.*?报道", "特约记者.*?", "本报记者.*?",
-        "报道称", "消息称", "消息人士称", "知情人士透露",
-        "according to", "reported by", "cited by", "quoted by",
-        "sources said", "officials said", "experts said", "researchers found"
-    ]
-    
     # 提取所有可能的来源
     sources = []
-    for indicator in source_indicators:
-        matches = re.finditer(indicator, text)
-        for match in matches:
+    for indicator in _SOURCE_INDICATOR_RES:
+        for match in indicator.finditer(text):
             # 提取匹配后的内容，最多30个字符
             start = match.end()
             end = min(start + 30, len(text))
@@ -392,17 +418,8 @@ def analyze_source_quality(text: str, url: Optional[str] = None) -> Tuple[float,
     
     # 提取引号中的内容作为可能的引用
     quotes = []
-    quote_patterns = [
-        r'"([^"]+)"',                      # 英文双引号
-        r"'([^']+)'",                      # 英文单引号
-        r"「([^」]+)」",                    # 中文单引号
-        r"『([^』]+)』",                    # 中文双引号
-        r"【([^】]+)】",                    # 中文方括号
-        r"《([^》]+)》"                     # 中文书名号
-    ]
-    
-    for pattern in quote_patterns:
-        for match in re.finditer(pattern, text):
+    for pattern in _QUOTE_RES:
+        for match in pattern.finditer(text):
             quote = match.group(1).strip()
             if len(quote) > 5:  # 只考虑长度大于5的引用
                 quotes.append(quote)
@@ -428,18 +445,9 @@ def analyze_source_quality(text: str, url: Optional[str] = None) -> Tuple[float,
         details.append("未检测到引用内容")
     
     # 检查是否包含数据和统计信息
-    data_patterns = [
-        r'\d+(?:\.\d+)?%',                 # 百分比
-        r'\d+(?:\.\d+)?\s*(?:亿|万|千|百)',  # 中文数量单位
-        r'\d+(?:\.\d+)?\s*(?:million|billion|thousand)', # 英文数量单位
-        r'增长\s*\d+(?:\.\d+)?%',           # 增长率
-        r'下降\s*\d+(?:\.\d+)?%',           # 下降率
-        r'上升\s*\d+(?:\.\d+)?%'            # 上升率
-    ]
-    
     data_count = 0
-    for pattern in data_patterns:
-        data_count += len(re.findall(pattern, text))
+    for pattern in _DATA_RES:
+        data_count += len(pattern.findall(text))
     
     if data_count >= 5:
         score += 0.1
@@ -503,13 +511,7 @@ def basic_logic_analysis(text: str) -> Tuple[float, str]:
         details.append("文本较长，基本分析显示有一定的逻辑结构和论述深度")
     
     # 逻辑连接词分析
-    logic_connectors = [
-        "因为", "所以", "因此", "由于", "如果", "那么", "但是", "然而",
-        "虽然", "尽管", "不过", "否则", "除非", "只有", "首先", "其次",
-        "最后", "总之", "换言之", "例如", "比如", "特别是", "尤其是"
-    ]
-    
-    connector_count = sum(1 for connector in logic_connectors if connector in text)
+    connector_count = sum(map(text.__contains__, _LOGIC_CONNECTORS))
     connector_density = connector_count / (len(text) / 100)  # 每100字的连接词数量
     
     if connector_density > 2:
@@ -529,14 +531,8 @@ def basic_logic_analysis(text: str) -> Tuple[float, str]:
         details.append("文本分为多个段落，结构较为完整")
     
     # 矛盾词分析
-    contradiction_pairs = [
-        ("增加", "减少"), ("上升", "下降"), ("提高", "降低"),
-        ("加强", "减弱"), ("扩大", "缩小"), ("加速", "减速"),
-        ("肯定", "否定"), ("支持", "反对"), ("赞成", "反对")
-    ]
-    
     contradiction_count = 0
-    for pair in contradiction_pairs:
+    for pair in _CONTRADICTION_PAIRS:
         if pair[0] in text and pair[1] in text:
             contradiction_count += 1
     
@@ -128,10 +128,147 @@ def load_environment_variables():
         logging.warning("未安装python-dotenv库，无法从.env文件加载环境变量")
         return False
 
+def _build_suffix_automaton(*texts):
+    """
+    构建字符串的（广义）后缀自动机
+    
+    参数:
+        texts: 要构建自动机的一个或多个字符串
+    
+    返回:
+        (transitions, links, lengths, origins): 各状态的转移表、后缀链接、最长子串长度，
+        以及该状态最长子串首次出现的(文本序号, 结束位置)
+    """
+    transitions = [{}]
+    links = [-1]
+    lengths = [0]
+    origins = [(0, 0)]
+    
+    def clone_state(p, q, char):
+        clone = len(lengths)
+        transitions.append(dict(transitions[q]))
+        links.append(links[q])
+        lengths.append(lengths[p] + 1)
+        origins.append(origins[q])
+        while p != -1 and transitions[p].get(char) == q:
+            transitions[p][char] = clone
+            p = links[p]
+        links[q] = clone
+        return clone
+    
+    for index, text in enumerate(texts):
+        # 每段文本都从初始状态开始扩展
+        last = 0
+        for end, char in enumerate(text, 1):
+            if char in transitions[last]:
+                # 该前缀已在自动机中，必要时拆分状态
+                q = transitions[last][char]
+                last = q if lengths[last] + 1 == lengths[q] else clone_state(last, q, char)
+                continue
+            
+            cur = len(lengths)
+            transitions.append({})
+            links.append(0)
+            lengths.append(lengths[last] + 1)
+            origins.append((index, end))
+            
+            p = last
+            while p != -1 and char not in transitions[p]:
+                transitions[p][char] = cur
+                p = links[p]
+            
+            if p != -1:
+                q = transitions[p][char]
+                if lengths[p] + 1 == lengths[q]:
+                    links[cur] = q
+                else:
+                    # 拆分状态q，克隆出长度为lengths[p]+1的新状态
+                    links[cur] = clone_state(p, q, char)
+            
+            last = cur
+    
+    return transitions, links, lengths, origins
+
+def find_repeated_phrases(texts, min_length=5, min_occurrences=2):
+    """
+    查找在多段文本中重复出现的短语
+    
+    对所有文本构建一个广义后缀自动机，统计每个状态出现在哪些文本中，
+    一次遍历即可得到全部重复短语，无需对文本两两调用find_common_substrings。
+    
+    参数:
+        texts: 文本列表（如句子列表）
+        min_length: 最小短语长度
+        min_occurrences: 短语至少出现在多少段文本中
+    
+    返回:
+        {短语: 包含该短语的文本数量}，只保留无法再向两侧延伸的最长短语
+    """
+    texts = [text for text in texts if text]
+    if len(texts) < min_occurrences:
+        return {}
+    
+    # 转换为小写以进行不区分大小写的比较
+    texts_lower = [text.lower() for text in texts]
+    transitions, links, lengths, origins = _build_suffix_automaton(*texts_lower)
+    
+    # 用整数位图记录每个状态出现在哪些文本中
+    masks = [0] * len(lengths)
+    for index, text in enumerate(texts_lower):
+        state = 0
+        for char in text:
+            state = transitions[state][char]
+            masks[state] |= 1 << index
+    
+    # 按长度从长到短沿后缀链接向上传播
+    order = sorted(range(1, len(lengths)), key=lengths.__getitem__, reverse=True)
+    for state in order:
+        masks[links[state]] |= masks[state]
+    
+    counts = [bin(mask).count('1') for mask in masks]
+    
+    # 后缀链接指向的状态若与子状态出现在同样多的文本中，说明它可以向左延伸
+    left_extendable = set(links[state] for state in order if counts[state] == counts[links[state]])
+    
+    phrases = {}
+    for state in order:
+        count = counts[state]
+        if lengths[state] < min_length or count < min_occurrences or state in left_extendable:
+            continue
+        # 向右延伸一个字符后仍出现在同样多的文本中，说明不是最长短语
+        if any(counts[target] == count for target in transitions[state].values()):
+            continue
+        index, end = origins[state]
+        phrases[texts[index][end - lengths[state]:end]] = count
+    
+    return phrases
+
+def _select_longest_substrings(substrings, max_substrings):
+    """
+    去重后按长度降序选出子串，跳过已包含在更长子串中的结果
+    
+    参数:
+        substrings: 候选子串列表
+        max_substrings: 最大返回子串数量
+    
+    返回:
+        按长度降序排序的子串列表
+    """
+    selected = []
+    for substring in sorted(dict.fromkeys(substrings), key=len, reverse=True):
+        if len(selected) >= max_substrings:
+            break
+        if not any(substring in existing for existing in selected):
+            selected.append(substring)
+    return selected
+
 def find_common_substrings(str1, str2, min_length=5, max_time=2, max_substrings=10):
     """
     查找两个字符串之间的共同子串
     
+    对str2构建后缀自动机，再用str1在自动机上匹配，得到str1每个位置结尾的最长公共子串，
+    只在匹配无法继续向右延伸时记录子串，整体复杂度为O(len1 + len2)。
+    
     参数:
         str1: 第一个字符串
         str2: 第二个字符串
@@ -152,35 +289,32 @@ def find_common_substrings(str1, str2, min_length=5, max_time=2, max_substrings=
     str1_lower = str1.lower()
     str2_lower = str2.lower()
     
-    # 动态规划方法查找所有公共子串
-    len1, len2 = len(str1_lower), len(str2_lower)
-    dp = [[0 for _ in range(len2 + 1)] for _ in range(len1 + 1)]
-    
-    for i in range(1, len1 + 1):
-        for j in range(1, len2 + 1):
-            # 检查是否超时
-            if (datetime.now() - start_time).total_seconds() > max_time:
-                logging.warning(f"查找公共子串超时，返回已找到的 {len(common_substrings)} 个结果")
-                # 按长度排序并返回前N个
-                return sorted(common_substrings, key=len, reverse=True)[:max_substrings]
-            
-            if str1_lower[i-1] == str2_lower[j-1]:
-                dp[i][j] = dp[i-1][j-1] + 1
-                if dp[i][j] >= min_length:
-                    # 找到一个长度至少为min_length的公共子串
-                    end = i
-                    start = end - dp[i][j]
-                    substring = str1[start:end]
-                    
-                    # 检查是否已经包含在现有子串中
-                    is_contained = False
-                    for existing in common_substrings:
-                        if substring in existing:
-                            is_contained = True
-                            break
-                    
-                    if not is_contained:
-                        common_substrings.append(substring)
-    
-    # 按长度排序并返回前N个
-    return sorted(common_substrings, key=len, reverse=True)[:max_substrings] 
\ No newline at end of file
+    transitions, links, lengths, _ = _build_suffix_automaton(str2_lower)
+    
+    state = 0
+    match_length = 0
+    for i, char in enumerate(str1_lower):
+        # 检查是否超时
+        if (datetime.now() - start_time).total_seconds() > max_time:
+            logging.warning(f"查找公共子串超时，返回已找到的 {len(common_substrings)} 个结果")
+            return _select_longest_substrings(common_substrings, max_substrings)
+        
+        previous_length = match_length
+        while state and char not in transitions[state]:
+            state = links[state]
+            match_length = lengths[state]
+        if char in transitions[state]:
+            state = transitions[state][char]
+            match_length += 1
+        else:
+            match_length = 0
+        
+        # 上一个位置结尾的公共子串无法再延伸，记录下来
+        if previous_length >= min_length and match_length != previous_length + 1:
+            common_substrings.append(str1[i - previous_length:i])
+    
+    if match_length >= min_length:
+        end = len(str1_lower)
+        common_substrings.append(str1[end - match_length:end])
+    
+    return _select_longest_substrings(common_substrings, max_substrings)